@@ -24,6 +24,26 @@ DEFAULT_MERAKI_PORT_CONFIG = {
 
 UPLINK_PORT_THRESHOLD = 48
 
+MAX_PRINTED_COMPARISON_ROWS = 200
+
+CONSOLE_MAX_LINES = 5000
+CONSOLE_DRAIN_INTERVAL_MS = 50
+
+INPUT_VALIDATION_DELAY_MS = 120
+
+BACKGROUND_TASK_MAX_WORKERS = 4
+
+MERAKI_BASE_URL = 'https://api-mp.meraki.com/api/v1'
+MERAKI_MAXIMUM_RETRIES = 5
+MERAKI_429_RETRY_WAIT_TIME = 1
+MERAKI_CACHE_TTL = 30
+MERAKI_PORT_IDS_CACHE_TTL = 3600
+MERAKI_ORGANIZATION_CACHE_TTL = 3600
+MERAKI_CACHE_MAX_ENTRIES = 1000
+MERAKI_BATCH_SERIAL_THRESHOLD = 2
+MERAKI_MAX_WORKERS = 5
+MERAKI_ACTION_BATCH_SIZE = 20
+
 STP_GUARD_DISABLED = 'disabled'
 STP_GUARD_BPDU = 'bpdu guard'
 STP_GUARD_ROOT = 'root guard'
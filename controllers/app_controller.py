@@ -87,6 +87,8 @@ class AppController:
     def _show_dashboard(self):
         """Show the dashboard."""
         if hasattr(self, '_current_wizard') and self._current_wizard:
+            # Leaving a wizard stops its conversion before the next Meraki update
+            self.conversion_controller.cancel_conversion()
             self._current_wizard.destroy()
             self._current_wizard = None
 
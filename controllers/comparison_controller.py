@@ -42,7 +42,7 @@ class ComparisonController:
         return self.modules.get(ScriptType.COMPARE_MAC)
 
     def run_interface_comparison(self, api_key, meraki_serials, catalyst_data,
-                                  hostname, console_widget=None):
+                                  hostname, console_widget=None, cancel_event=None):
         """
         Run interface comparison.
 
@@ -52,9 +52,10 @@ class ComparisonController:
             catalyst_data: Captured Catalyst interface data
             hostname: Switch hostname
             console_widget: Optional console widget for output
+            cancel_event: Optional threading.Event; once set, the comparison raises CancelledError
 
         Returns:
-            Comparison results or None on error
+            pd.DataFrame of comparison results (one row per compared entry) or None on error
         """
         compare_module = self.get_interface_module()
         if not compare_module:
@@ -68,14 +69,15 @@ class ComparisonController:
                 catalyst_ip=None,
                 catalyst_interfaces=catalyst_data,
                 name=hostname,
-                credentials_list=None
+                credentials_list=None,
+                cancel_event=cancel_event
             )
             return results
 
         return do_comparison()
 
     def run_mac_comparison(self, api_key, meraki_serials, catalyst_data,
-                           hostname, console_widget=None):
+                           hostname, console_widget=None, cancel_event=None):
         """
         Run MAC address comparison.
 
@@ -85,9 +87,10 @@ class ComparisonController:
             catalyst_data: Captured Catalyst MAC data
             hostname: Switch hostname
             console_widget: Optional console widget for output
+            cancel_event: Optional threading.Event; once set, the comparison raises CancelledError
 
         Returns:
-            Comparison results or None on error
+            pd.DataFrame of comparison results (one row per compared entry) or None on error
         """
         compare_module = self.get_mac_module()
         if not compare_module:
@@ -101,7 +104,8 @@ class ComparisonController:
                 catalyst_ip=None,
                 catalyst_macs=catalyst_data,
                 name=hostname,
-                credentials_list=None
+                credentials_list=None,
+                cancel_event=cancel_event
             )
             return results
 
@@ -3,6 +3,7 @@ Controller for the conversion/migration functionality.
 """
 
 import traceback
+from concurrent.futures import CancelledError
 from tkinter import messagebox
 
 from utils.workers import BackgroundTask
@@ -30,6 +31,7 @@ class ConversionController:
         self.credentials_model = credentials_model
         self.serials_model = serials_model
         self.modules = modules
+        self._conversion_task = None
 
     def run_conversion(self, wizard_data, console_widget=None):
         """
@@ -110,16 +112,17 @@ class ConversionController:
         self._append_console(console_widget,
                             "Interface format: Auto-detected\n")
 
-        def run_conversion():
+        def run_conversion(cancel_event):
             convert_module.run(
                 meraki_api_key=api_key,
                 meraki_cloud_ids=meraki_serials,
                 catalyst_ip=catalyst_ip,
-                credentials_list=credentials_list
+                credentials_list=credentials_list,
+                cancel_event=cancel_event
             )
             return None
 
-        BackgroundTask.run(
+        self._conversion_task = BackgroundTask.run(
             run_conversion,
             console_widget=console_widget,
             success_callback=lambda r: self._on_success(console_widget),
@@ -161,24 +164,36 @@ class ConversionController:
         self._append_console(console_widget,
                             "Interface format: Auto-detected\n")
 
-        def run_conversion():
+        def run_conversion(cancel_event):
             convert_module.run(
                 meraki_api_key=api_key,
                 meraki_cloud_ids=meraki_serials,
-                catalyst_config=catalyst_config
+                catalyst_config=catalyst_config,
+                cancel_event=cancel_event
             )
             return None
 
-        BackgroundTask.run(
+        self._conversion_task = BackgroundTask.run(
             run_conversion,
             console_widget=console_widget,
             success_callback=lambda r: self._on_success(console_widget),
             error_callback=lambda e: self._on_error(e, console_widget)
         )
 
+    def cancel_conversion(self):
+        """
+        Stop the running conversion, if any, before its next Meraki port update or batch.
+
+        Updates already sent to the Dashboard are not rolled back.
+        """
+        if self._conversion_task is not None:
+            self._conversion_task.cancel()
+            self._conversion_task = None
+
     def _append_console(self, console_widget, text):
         """Append text to console widget."""
-        if console_widget:
+        # The wizard owning the console may have been closed while the task ran
+        if console_widget and console_widget.winfo_exists():
             console_widget.insert('end', text)
             console_widget.see('end')
 
@@ -189,13 +204,18 @@ class ConversionController:
 
     def _on_error(self, error, console_widget):
         """Handle conversion error."""
+        if isinstance(error, CancelledError):
+            self._append_console(console_widget, "\nConfiguration conversion cancelled.\n")
+            return
+
         error_message = f"Error during conversion: {str(error)}"
         self._append_console(console_widget, f"\n{error_message}\n")
 
         if console_widget:
-            import io
-            tb_io = io.StringIO()
-            traceback.print_exc(file=tb_io)
-            self._append_console(console_widget, tb_io.getvalue())
+            # Runs on the Tk thread after the task has finished, so format the
+            # error's own traceback rather than the (empty) current exception
+            self._append_console(console_widget,
+                                ''.join(traceback.format_exception(
+                                    type(error), error, error.__traceback__)))
 
         messagebox.showerror("Error", error_message)
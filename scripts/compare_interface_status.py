@@ -1,12 +1,15 @@
-import re
 import os
 import sys
+import csv
+from operator import itemgetter
 import meraki
 import pandas as pd
 
+from utils.context_executor import ContextThreadPoolExecutor, raise_if_cancelled
 from utils.netmiko_utils import get_running_config
-from utils.interface_parser import InterfaceParser
-from config.constants import DEFAULT_READ_TIMEOUT
+from utils.interface_parser import parse_interface
+from utils.meraki_utils import get_dashboard, get_cached, get_organization_id, fetch_for_serials
+from config.constants import DEFAULT_READ_TIMEOUT, MERAKI_BATCH_SERIAL_THRESHOLD
 
 failures = []
 credentials = []
@@ -24,38 +27,26 @@ def map_catalyst_to_meraki_interfaces(catalyst_status, meraki_serials):
         dict: A dictionary where Catalyst interface names are mapped to Meraki switches and their port numbers.
     """
     mapping = {}
+    serial_count = len(meraki_serials)
     for curr_interface in catalyst_status:
 
         interface = curr_interface['interface']
-        status = curr_interface['status']
-
-        port_number = InterfaceParser.extract_port_number(interface, 'catalyst_generic')
 
-        if port_number is None:
-            port_number = InterfaceParser.extract_port_number(interface, 'catalyst_full_interface')
-
-        if port_number is None:
+        parsed = parse_interface(interface, 'catalyst_comparison')
+        if not parsed:
             print(f"Could not parse interface name: {interface}")
             continue
 
-        parsed = InterfaceParser.parse_interface(interface, 'catalyst_generic')
-        if parsed:
-            switch_number = int(parsed[1])
-        else:
-            parsed = InterfaceParser.parse_interface(interface, 'catalyst_full_interface')
-            if parsed:
-                switch_number = int(parsed[1])
-            else:
-                print(f"Could not parse interface name: {interface}")
-                continue
-
+        # Reject stack members without a Meraki serial before doing any more work
+        switch_number = int(parsed[1])
         meraki_index = switch_number - 1
-        if meraki_index >= len(meraki_serials):
+        if meraki_index >= serial_count:
             print(f"No Meraki switch for Catalyst switch number {switch_number}")
             continue
 
+        status = curr_interface['status']
         meraki_serial = meraki_serials[meraki_index]
-        meraki_port_id = port_number
+        meraki_port_id = int(parsed[2])
 
         mapping[interface] = {
             'meraki_serial': meraki_serial,
@@ -66,27 +57,86 @@ def map_catalyst_to_meraki_interfaces(catalyst_status, meraki_serials):
     return mapping
 
 
-def get_meraki_switch_ports_statuses(api_key, meraki_serials):
+def get_organization_switch_ports_statuses(dashboard, api_key, meraki_serials, organization_id=None):
+    """
+    Retrieves port statuses for several Meraki switches with one organization-wide paginated call.
+
+    Args:
+        dashboard (meraki.DashboardAPI): Dashboard client to query with.
+        api_key (str): API key the dashboard was created with.
+        meraki_serials (list): List of Meraki switch serial numbers.
+        organization_id (str, optional): Organization owning the switches. If None, the API key's
+                                         organization is used when it has access to exactly one.
+
+    Returns:
+        dict: Meraki serial numbers mapped to lists of port statuses, or None if the
+              organization-wide endpoint can't be used and switches must be queried individually.
+    """
+    organization_id = get_organization_id(dashboard, api_key, organization_id)
+    if organization_id is None:
+        return None
+
+    try:
+        response = dashboard.switch.getOrganizationSwitchPortsStatusesBySwitch(
+            organization_id, total_pages='all', serials=list(meraki_serials)
+        )
+    except (meraki.APIError, AttributeError) as e:
+        print(f"Organization-wide port status lookup unavailable, querying switches individually: {e}")
+        return None
+
+    items = response.get('items', []) if isinstance(response, dict) else response
+    meraki_ports_status = {serial: [] for serial in meraki_serials}
+    for item in items:
+        if item.get('serial') in meraki_ports_status:
+            meraki_ports_status[item['serial']] = item.get('ports', [])
+
+    return meraki_ports_status
+
+
+def get_meraki_switch_ports_statuses(api_key, meraki_serials, organization_id=None, cancel_event=None):
     """
     Retrieves the port statuses for the specified Meraki switches using the Meraki Dashboard API.
 
+    When more than MERAKI_BATCH_SERIAL_THRESHOLD switches are requested, a single
+    organization-wide call is tried first, falling back to concurrent calls per switch.
+
     Args:
         api_key (str): The API key for authenticating with the Meraki Dashboard.
         meraki_serials (list): List of Meraki switch serial numbers.
+        organization_id (str, optional): Organization owning the switches, used for the batched lookup.
+        cancel_event (threading.Event, optional): Once set, switches not yet queried are skipped
+                                                  and CancelledError is raised.
 
     Returns:
         dict: A dictionary where Meraki serial numbers map to lists of port statuses.
     """
-    dashboard = meraki.DashboardAPI(api_key, suppress_logging=True)
-    meraki_ports_status = {}
+    dashboard = get_dashboard(api_key)
+    meraki_ports_status = None
+
+    if len(meraki_serials) > MERAKI_BATCH_SERIAL_THRESHOLD:
+        meraki_ports_status = get_cached(
+            ('organization_ports_statuses', api_key, organization_id, tuple(meraki_serials)),
+            lambda: get_organization_switch_ports_statuses(dashboard, api_key, meraki_serials, organization_id)
+        )
+
+    if meraki_ports_status is None:
+        meraki_ports_status = fetch_for_serials(
+            lambda serial: get_cached(
+                ('ports_statuses', api_key, serial),
+                lambda: dashboard.switch.getDeviceSwitchPortsStatuses(serial)
+            ),
+            meraki_serials,
+            'port statuses',
+            cancel_event
+        )
 
-    for serial in meraki_serials:
-        try:
-            ports_status = dashboard.switch.getDeviceSwitchPortsStatuses(serial)
-            meraki_ports_status[serial] = ports_status
-        except meraki.APIError as e:
-            print(f"Error retrieving port statuses for Meraki switch {serial}: {e}")
-            meraki_ports_status[serial] = []
+    # Uplink module ports have IDs such as '1_MA-MOD-4X10G_1'; only numeric IDs
+    # can match a Catalyst port number, so only those get a '_port_id'
+    for ports_status in meraki_ports_status.values():
+        for port in ports_status:
+            port_id = port['portId']
+            if port_id.isdigit():
+                port['_port_id'] = int(port_id)
 
     return meraki_ports_status
 
@@ -100,36 +150,63 @@ def compare_port_statuses(mapping, meraki_ports_status):
         meraki_ports_status (dict): A dictionary containing the statuses of Meraki switch ports.
 
     Returns:
-        list: A list of dictionaries comparing the statuses of Catalyst and Meraki ports.
+        pd.DataFrame: One row per Catalyst interface comparing the statuses of Catalyst and Meraki ports.
     """
-    comparison_results = []
-
+    # Results are collected column-wise and turned into a DataFrame once,
+    # rather than allocating a dict per compared interface.
+    catalyst_interfaces = []
+    catalyst_statuses = []
+    meraki_serials = []
+    meraki_port_ids = []
+    meraki_statuses = []
+    matches = []
+
+    # Group interfaces by Meraki switch so each switch's port list is fetched
+    # and indexed once rather than looked up again for every interface.
+    interfaces_by_serial = {}
     for catalyst_interface, info in mapping.items():
-        meraki_serial = info['meraki_serial']
-        meraki_port_id = info['meraki_port_id']
-        catalyst_status = info['catalyst_status']
-
-        meraki_ports = meraki_ports_status.get(meraki_serial, [])
-        meraki_status = 'unknown'
-        for port in meraki_ports:
-            if int(port['portId']) == meraki_port_id:
+        interfaces_by_serial.setdefault(info['meraki_serial'], []).append((catalyst_interface, info))
+
+    get_port_and_status = itemgetter('meraki_port_id', 'catalyst_status')
+
+    for meraki_serial, interfaces in interfaces_by_serial.items():
+        # Index the switch's ports by the numeric portId set in
+        # get_meraki_switch_ports_statuses; the first port seen for an id wins
+        # and ports without a numeric id are skipped.
+        port_index = {}
+        for port in meraki_ports_status.get(meraki_serial, []):
+            port_id = port.get('_port_id')
+            if port_id is not None:
+                port_index.setdefault(port_id, port)
+
+        for catalyst_interface, info in interfaces:
+            meraki_port_id, catalyst_status = get_port_and_status(info)
+
+            port = port_index.get(meraki_port_id)
+            meraki_status = 'unknown'
+            if port is not None:
                 meraki_status = port.get('status', 'unknown').lower()
                 meraki_status = 'up' if meraki_status == 'connected' else 'down'
-                break
-
-        comparison_results.append({
-            'Catalyst_Interface': catalyst_interface,
-            'Catalyst_Status': catalyst_status,
-            'Meraki_Serial': meraki_serial,
-            'Meraki_PortId': meraki_port_id,
-            'Meraki_Status': meraki_status,
-            'Match': catalyst_status == meraki_status,
-        })
-
-    return comparison_results
-
 
-def run(meraki_api_key, meraki_cloud_ids, catalyst_ip=None, catalyst_interfaces=None, name=None, credentials_list=None):
+            catalyst_interfaces.append(catalyst_interface)
+            catalyst_statuses.append(catalyst_status)
+            meraki_serials.append(meraki_serial)
+            meraki_port_ids.append(meraki_port_id)
+            meraki_statuses.append(meraki_status)
+            matches.append(catalyst_status == meraki_status)
+
+    return pd.DataFrame({
+        'Catalyst_Interface': catalyst_interfaces,
+        'Catalyst_Status': catalyst_statuses,
+        'Meraki_Serial': meraki_serials,
+        'Meraki_PortId': meraki_port_ids,
+        'Meraki_Status': meraki_statuses,
+        'Match': matches,
+    })
+
+
+def run(meraki_api_key, meraki_cloud_ids, catalyst_ip=None, catalyst_interfaces=None, name=None, credentials_list=None,
+        organization_id=None, cancel_event=None):
     """
     Main execution function to run the comparison between Catalyst and Meraki port statuses.
 
@@ -140,18 +217,29 @@ def run(meraki_api_key, meraki_cloud_ids, catalyst_ip=None, catalyst_interfaces=
         catalyst_interfaces (list, optional): List of Catalyst interface statuses.
         name (str, optional): Hostname of the Catalyst switch.
         credentials_list (list, optional): List of credential dicts for Netmiko connection.
+        organization_id (str, optional): Meraki organization ID for the batched port status lookup.
+        cancel_event (threading.Event, optional): Set to stop the comparison; CancelledError is then raised.
 
     Returns:
-        tuple: A tuple containing comparison results and the Catalyst switch hostname.
+        tuple: A tuple containing the comparison results DataFrame and the Catalyst switch hostname.
     """
     if credentials_list is None:
         credentials_list = credentials
 
-    if catalyst_interfaces is None:
-        if not catalyst_ip:
-            print("Error: Either catalyst_ip or catalyst_interfaces must be provided.")
-            return None, None
+    if catalyst_interfaces is None and not catalyst_ip:
+        print("Error: Either catalyst_ip or catalyst_interfaces must be provided.")
+        return None, None
 
+    # Meraki port statuses don't depend on the Catalyst data, so fetch them on a
+    # worker thread while the SSH session to the Catalyst switch runs. The worker is a
+    # daemon thread, so a fetch still running when the app closes doesn't delay exit.
+    executor = ContextThreadPoolExecutor(max_workers=1)
+    meraki_future = executor.submit(
+        get_meraki_switch_ports_statuses, meraki_api_key, meraki_cloud_ids, organization_id, cancel_event
+    )
+    executor.shutdown(wait=False)
+
+    if catalyst_interfaces is None:
         print(f"Connecting to Catalyst switch at {catalyst_ip}...")
         catalyst_interfaces, name = get_running_config(
             ip_address=catalyst_ip,
@@ -163,12 +251,18 @@ def run(meraki_api_key, meraki_cloud_ids, catalyst_ip=None, catalyst_interfaces=
 
         if not catalyst_interfaces:
             print("Failed to retrieve Catalyst interface statuses.")
+            # The statuses are no longer needed; drop the fetch if it hasn't started
+            meraki_future.cancel()
             return None, None
 
         print(f"Retrieved interface statuses from {name}.")
-        pd.DataFrame(catalyst_interfaces).to_csv(f'{name}_interface_status.csv', index=False)
+        with open(f'{name}_interface_status.csv', 'w', newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=list(catalyst_interfaces[0].keys()))
+            writer.writeheader()
+            writer.writerows(catalyst_interfaces)
 
-    meraki_ports_status = get_meraki_switch_ports_statuses(meraki_api_key, meraki_cloud_ids)
+    raise_if_cancelled(cancel_event)
+    meraki_ports_status = meraki_future.result()
 
     mapping = map_catalyst_to_meraki_interfaces(catalyst_interfaces, meraki_cloud_ids)
 
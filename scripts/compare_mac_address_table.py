@@ -1,132 +1,153 @@
-import re
 import os
 import sys
-import meraki
+import csv
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
 
 from utils.netmiko_utils import get_running_config
 from utils.interface_parser import InterfaceParser
-from config.constants import UPLINK_PORT_THRESHOLD
+from utils.context_executor import raise_if_cancelled
+from utils.meraki_utils import get_dashboard, get_cached, fetch_for_serials
+from config.constants import UPLINK_PORT_THRESHOLD, MAX_PRINTED_COMPARISON_ROWS
 
 failures = []
 credentials = []
 
+# Separators used by Cisco (aabb.cc00.0001) and Meraki (aa:bb:cc:00:00:01) MAC formats
+_MAC_SEPARATORS = str.maketrans('', '', ':-. ')
 
-def get_meraki_clients(api_key, meraki_serials):
-    dashboard = meraki.DashboardAPI(api_key, suppress_logging=True)
-    meraki_clients = {}
-    for serial in meraki_serials:
-        try:
-            timespan = 86400
-            clients = dashboard.devices.getDeviceClients(serial, timespan=timespan)
-            meraki_clients[serial] = clients
-        except meraki.APIError as e:
-            print(f"Error retrieving clients for Meraki switch {serial}: {e}")
-            meraki_clients[serial] = []
-    return meraki_clients
+# Anchored at both ends because str.extract only searches; this matches the whole
+# name, like InterfaceParser.parse_interface's fullmatch
+_COMPARISON_PORT = '^' + InterfaceParser.PATTERN_SOURCES['catalyst_comparison'] + '$'
 
 
-def map_catalyst_to_meraki_ports(mac_table, meraki_serials):
-    mapping = []
-    for entry in mac_table:
-        catalyst_port = entry['port']
-        vlan = entry['vlan']
-        mac = entry['mac_address']
-
-        port_number = InterfaceParser.extract_port_number(catalyst_port, 'catalyst_generic')
-
-        if port_number is None:
-            print(f"Could not parse port name: {catalyst_port}")
-            continue
-
-        parsed = InterfaceParser.parse_interface(catalyst_port, 'catalyst_generic')
-        if not parsed:
-            print(f"Could not parse port name: {catalyst_port}")
-            continue
-
-        switch_number = int(parsed[1])
-
-        meraki_index = switch_number - 1
-        if meraki_index >= len(meraki_serials):
-            print(f"No Meraki switch for Catalyst switch number {switch_number}")
-            continue
-        meraki_serial = meraki_serials[meraki_index]
-        meraki_port_id = port_number
-
-        mapping.append({
-            'catalyst_port': catalyst_port,
-            'meraki_serial': meraki_serial,
-            'meraki_port_id': meraki_port_id,
-            'vlan': vlan,
-            'mac': mac,
-        })
-    return mapping
+def get_meraki_clients(api_key, meraki_serials, cancel_event=None):
+    dashboard = get_dashboard(api_key)
+    timespan = 86400
+
+    def fetch_clients(serial):
+        clients = get_cached(
+            ('clients', api_key, serial, timespan),
+            lambda: dashboard.devices.getDeviceClients(serial, timespan=timespan)
+        )
+        for client in clients:
+            client['_clean_mac'] = clean_mac(client.get('mac', ''))
+            client['_switchport'] = str(client.get('switchport', ''))
+        return clients
+
+    return fetch_for_serials(fetch_clients, meraki_serials, 'clients', cancel_event)
 
 
+def map_catalyst_to_meraki_ports(mac_table, meraki_serials):
+    entries = pd.DataFrame(mac_table, columns=['mac_address', 'vlan', 'port'])
+
+    # Extract (interface_type, switch_number, port_number) once per distinct port; access
+    # ports usually carry several MACs, so this is far fewer parses than entries
+    unique_ports = entries['port'].drop_duplicates().to_numpy()
+    parts = (
+        pd.Series(unique_ports, dtype=object).str.extract(_COMPARISON_PORT)
+        .set_axis(unique_ports)
+        .reindex(entries['port'].to_numpy())
+        .set_axis(entries.index)
+    )
+    parsed = parts[1].notna()
+    for catalyst_port in entries.loc[~parsed, 'port']:
+        print(f"Could not parse port name: {catalyst_port}")
+    entries = entries[parsed]
+    parts = parts[parsed]
+
+    # Reject stack members without a Meraki serial
+    switch_numbers = parts[1].astype(int).to_numpy()
+    in_range = switch_numbers - 1 < len(meraki_serials)
+    for switch_number in switch_numbers[~in_range]:
+        print(f"No Meraki switch for Catalyst switch number {switch_number}")
+
+    return pd.DataFrame({
+        'catalyst_port': entries['port'].to_numpy()[in_range],
+        'meraki_serial': np.asarray(meraki_serials, dtype=object)[switch_numbers[in_range] - 1],
+        'meraki_port_id': parts['port'].to_numpy()[in_range].astype(int),
+        'vlan': entries['vlan'].to_numpy()[in_range],
+        'mac': entries['mac_address'].to_numpy()[in_range],
+    })
+
+
+def is_uplink_port(port):
+    parts = port.split('/')
+    return len(parts) > 2 and parts[2].isdigit() and int(parts[2]) > UPLINK_PORT_THRESHOLD
+
+
+@lru_cache(maxsize=8192)
 def clean_mac(mac_address):
-    return ''.join(char for char in mac_address if char.isalnum())
+    return mac_address.translate(_MAC_SEPARATORS).lower()
 
 
 def compare_mac_addresses(mapping, meraki_clients):
-    comparison_results = []
-    for entry in mapping:
-        mac = entry['mac'].lower()
-        catalyst_vlan = entry['vlan']
-        catalyst_port = entry['catalyst_port']
-        meraki_serial = entry['meraki_serial']
-        meraki_port_id = entry['meraki_port_id']
-
-        clients = meraki_clients.get(meraki_serial, [])
-        client_found = False
-        for client in clients:
-            client_mac = client.get('mac', '').lower()
-            client_vlan = client.get('vlan', '')
-            client_switchport = client.get('switchport', '')
-            clean_client_mac_address = clean_mac(client_mac)
-            clean_mac_address = clean_mac(mac)
-            if clean_client_mac_address == clean_mac_address:
-                client_found = True
-                break
-
-        if client_found:
-            comparison_results.append({
-                'MAC_Address': mac,
-                'Catalyst_Port': catalyst_port,
-                'Catalyst_VLAN': catalyst_vlan,
-                'Meraki_Serial': meraki_serial,
-                'Meraki_PortId': client_switchport,
-                'Meraki_VLAN': client_vlan,
-                'Status': 'Match' if str(meraki_port_id) == str(client_switchport) else 'Port Mismatch',
-            })
-        else:
-            comparison_results.append({
-                'MAC_Address': mac,
-                'Catalyst_Port': catalyst_port,
-                'Catalyst_VLAN': catalyst_vlan,
-                'Meraki_Serial': meraki_serial,
-                'Meraki_PortId': 'N/A',
-                'Meraki_VLAN': 'N/A',
-                'Status': 'Not Found in Meraki',
-            })
-    return comparison_results
- 
-def run(meraki_api_key, meraki_cloud_ids, catalyst_ip=None, catalyst_macs=None, name=None, credentials_list=None):
+    entries = pd.DataFrame(mapping, columns=['catalyst_port', 'meraki_serial', 'meraki_port_id', 'vlan', 'mac'])
+    entries['mac'] = entries['mac'].str.lower()
+    entries['clean_mac'] = entries['mac'].str.translate(_MAC_SEPARATORS)
+
+    # Flatten the per-switch clients (MACs normalized in get_meraki_clients) so
+    # the comparison is a single hash join; the first client reported for a MAC wins.
+    clients = pd.DataFrame(
+        [
+            (serial, client['_clean_mac'], client.get('switchport', ''), client.get('vlan', ''), client['_switchport'])
+            for serial, serial_clients in meraki_clients.items()
+            for client in serial_clients
+        ],
+        columns=['meraki_serial', 'clean_mac', 'client_switchport', 'client_vlan', 'client_switchport_str'],
+        dtype=object,
+    ).drop_duplicates(subset=['meraki_serial', 'clean_mac'])
+
+    # Only each client's row position goes through the left join; a column holding the
+    # unmatched rows' NaN would turn a missing VLAN into nan and VLAN 10 into 10.0, so the
+    # client fields are taken from their own columns afterwards, as the reported objects.
+    clients['client_row'] = np.arange(len(clients))
+    merged = entries.merge(
+        clients[['meraki_serial', 'clean_mac', 'client_row']],
+        on=['meraki_serial', 'clean_mac'], how='left', validate='m:1'
+    )
+    found = merged['client_row'].notna().to_numpy()
+    client_rows = merged['client_row'].to_numpy()[found].astype(int)
+
+    def client_field(column):
+        values = np.full(len(merged), 'N/A', dtype=object)
+        values[found] = clients[column].to_numpy(dtype=object)[client_rows]
+        # An explicit object Series, or a column of strings and None is inferred as strings with NaN
+        return pd.Series(values, index=merged.index, dtype=object)
+
+    port_match = merged['meraki_port_id'].astype(str) == client_field('client_switchport_str')
+
+    return pd.DataFrame({
+        'MAC_Address': merged['mac'],
+        'Catalyst_Port': merged['catalyst_port'],
+        'Catalyst_VLAN': merged['vlan'],
+        'Meraki_Serial': merged['meraki_serial'],
+        'Meraki_PortId': client_field('client_switchport'),
+        'Meraki_VLAN': client_field('client_vlan'),
+        'Status': np.where(found, np.where(port_match, 'Match', 'Port Mismatch'), 'Not Found in Meraki'),
+    })
+
+
+def run(meraki_api_key, meraki_cloud_ids, catalyst_ip=None, catalyst_macs=None, name=None, credentials_list=None,
+        cancel_event=None):
     """
     Main execution function to run the comparison between Catalyst and Meraki port statuses. Either the Catalyst switch IP or
     Catalyst interface statuses must be provided.
 
     Args:
-        meraki_api_key (str): API key for accessing the Meraki Dashboard.
+        meraki_api_key (str): API key for accessing the Meraki Dashboard. Falls back to MERAKI_API_KEY if empty.
         meraki_cloud_ids (list): List of Meraki switch serials.
         catalyst_ip (str): IP address of the Catalyst switch (optional).
         catalyst_macs (list): List of Catalyst MAC address table entries (optional).
         name (str): Hostname of the Catalyst switch (optional).
         credentials_list (list, optional): List of credential dicts for Netmiko connection.
+        cancel_event (threading.Event, optional): Set to stop the comparison; CancelledError is then raised.
 
     Returns:
-        tuple: A tuple containing comparison results and the Catalyst switch hostname.
+        tuple: A tuple containing the comparison results DataFrame and the Catalyst switch hostname.
     """
+    meraki_api_key = meraki_api_key or os.getenv("MERAKI_API_KEY")
     if credentials_list is None:
         credentials_list = credentials
 
@@ -148,42 +169,44 @@ def run(meraki_api_key, meraki_cloud_ids, catalyst_ip=None, catalyst_macs=None,
             print("Failed to retrieve MAC address table from Catalyst switch.")
             return None, None
 
-        macs_df = pd.DataFrame(macs_raw)
-        macs_df.rename(columns={'destination_address': 'mac_address', 'destination_port': 'port', 'vlan_id': 'vlan'}, inplace=True)
-        macs_df['port'] = macs_df['port'].apply(lambda x: x[0])
-        macs_df = macs_df[['mac_address', 'vlan', 'port']]
-
-        catalyst_macs = macs_df[macs_df['port'].str.contains('Gi')]
+        catalyst_macs = [
+            {'mac_address': row['destination_address'], 'vlan': row['vlan_id'], 'port': port}
+            for row in macs_raw
+            if (port := row['destination_port'][0]).startswith('Gi') and not is_uplink_port(port)
+        ]
 
-        catalyst_macs = catalyst_macs[~catalyst_macs['port'].apply(
-            lambda x: int(x.split('/')[2]) > UPLINK_PORT_THRESHOLD
-        )]
+        with open(f'{name}_macs_address_table.csv', 'w', newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=['mac_address', 'vlan', 'port'])
+            writer.writeheader()
+            writer.writerows(catalyst_macs)
 
-        catalyst_macs.to_csv(f'{name}_macs_address_table.csv', index=False)
-        catalyst_macs = catalyst_macs.to_dict('records')
-        
-    meraki_api_key = os.getenv("MERAKI_API_KEY")
-    meraki_cloud_ids = meraki_cloud_ids
-    target_device = {'IPAddress': catalyst_ip}
     print(f"Retrieved {len(catalyst_macs)} MAC address entries from Catalyst switch.")
 
+    raise_if_cancelled(cancel_event)
     print("Retrieving clients from Meraki switches...")
-    meraki_clients = get_meraki_clients(meraki_api_key, meraki_cloud_ids)
+    meraki_clients = get_meraki_clients(meraki_api_key, meraki_cloud_ids, cancel_event)
 
     mapping = map_catalyst_to_meraki_ports(catalyst_macs, meraki_cloud_ids)
     print(f"Mapped {len(mapping)} Catalyst MAC entries to Meraki ports.")
 
     comparison_results = compare_mac_addresses(mapping, meraki_clients)
-    pd.DataFrame(comparison_results).to_csv(f'{name}_mac_difs.csv', index=False)
+
+    comparison_csv = f'{name}_mac_comparison.csv'
+    comparison_results.to_csv(comparison_csv, index=False)
 
     print("\nMAC Address Comparison:")
-    for result in comparison_results:
-        print(f"MAC {result['MAC_Address']} on Catalyst {result['Catalyst_Port']} (VLAN {result['Catalyst_VLAN']}) "
-              f"-> Meraki Switch {result['Meraki_Serial']} Port {result['Meraki_PortId']} (VLAN {result['Meraki_VLAN']}) "
-              f"Status: {result['Status']}")
-        
-    comparison_results_df = pd.DataFrame(comparison_results)
-    comparison_results_df.to_csv(f'{name}_mac_comparison.csv', index=False)
+    if len(comparison_results) > MAX_PRINTED_COMPARISON_ROWS:
+        print(f"{len(comparison_results)} entries compared; see {comparison_csv} for details.")
+    elif len(comparison_results):
+        # One write for the whole report; each write is a widget insert when redirected to the GUI console
+        lines = [
+            f"MAC {result.MAC_Address} on Catalyst {result.Catalyst_Port} (VLAN {result.Catalyst_VLAN}) "
+            f"-> Meraki Switch {result.Meraki_Serial} Port {result.Meraki_PortId} (VLAN {result.Meraki_VLAN}) "
+            f"Status: {result.Status}"
+            for result in comparison_results.itertuples(index=False)
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+
     return comparison_results, name
     
 
@@ -3,14 +3,25 @@ import sys
 import os
 import meraki
 
+from utils.context_executor import ContextThreadPoolExecutor, raise_if_cancelled
 from utils.netmiko_utils import get_running_config
 from utils.port_config_builder import build_meraki_port_config
-from utils.interface_parser import InterfaceParser
-from config.constants import DEFAULT_READ_TIMEOUT
+from utils.interface_parser import parse_interface_auto, format_from_counts, FormatType, ETHERNET_PREFIXES
+from utils.meraki_utils import get_dashboard, get_organization_id, get_cached
+from config.constants import (
+    DEFAULT_READ_TIMEOUT,
+    MERAKI_MAX_WORKERS,
+    MERAKI_ACTION_BATCH_SIZE,
+    MERAKI_PORT_IDS_CACHE_TTL,
+)
 
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# An interface section runs until the next line starting with '!', so a '!' inside
+# a description does not cut the section short.
+_INTERFACE_SECTION = re.compile(r'^interface (\S+)(.*?)^!', re.DOTALL | re.MULTILINE)
+
 
 def parse_interfaces(config):
     """
@@ -20,57 +31,179 @@ def parse_interfaces(config):
         config (str): The running configuration from the Catalyst switch.
 
     Returns:
-        dict: A dictionary where the keys are interface names and values are configurations.
+        dict: A dictionary where the keys are Ethernet interface names and values are configurations.
+              SVIs, loopbacks, port-channels and other non-Ethernet sections are skipped.
+    """
+    return {
+        match.group(1): match.group(2)
+        for match in _INTERFACE_SECTION.finditer(config)
+        if match.group(1).startswith(ETHERNET_PREFIXES)
+    }
+
+
+def get_existing_port_ids(dashboard, api_key, serial):
+    """
+    Returns the port IDs present on a Meraki switch.
+
+    A switch's ports are fixed by its hardware, so the lookup is cached per serial for
+    MERAKI_PORT_IDS_CACHE_TTL seconds to avoid repeating it on every run in a session.
+    Use clear_cached(('switch_port_ids', api_key, serial)) to invalidate it.
+
+    Args:
+        dashboard (meraki.DashboardAPI): Dashboard client to query with.
+        api_key (str): API key the dashboard was created with, part of the cache key.
+        serial (str): Meraki switch serial number.
+
+    Returns:
+        frozenset: Port IDs as strings.
     """
-    interfaces = {}
-    interface_sections = re.findall(r'interface (\S+)(.*?)!', config, re.DOTALL)
-    for interface, config in interface_sections:
-        interfaces[interface] = config
-    return interfaces
+    return get_cached(
+        ('switch_port_ids', api_key, serial),
+        lambda: frozenset(str(port['portId']) for port in dashboard.switch.getDeviceSwitchPorts(serial)),
+        ttl=MERAKI_PORT_IDS_CACHE_TTL
+    )
 
 
-def configure_meraki_switch_ports(api_key, meraki_ports_map):
+def build_port_update(port):
+    """
+    Builds the updateDeviceSwitchPort keyword arguments for a Meraki port configuration.
+
+    Args:
+        port (dict): A Meraki port configuration from build_meraki_port_config.
+
+    Returns:
+        dict: Keyword arguments for the port update, excluding serial and portId.
+    """
+    return {
+        'name': port['name'],
+        'tags': None,
+        'enabled': port['enabled'],
+        'type': port['type'],
+        'vlan': int(port['vlan']),
+        'voiceVlan': int(port['voiceVlan']) if port['voiceVlan'] else None,
+        'allowedVlans': port['allowedVlans'] if port['type'] == 'trunk' else '1-1000',
+        'poeEnabled': port['poeEnabled'],
+        'isolationEnabled': port['isolationEnabled'],
+        'rstpEnabled': port['rstpEnabled'],
+        'stpGuard': port['stpGuard'],
+        'linkNegotiation': port['linkNegotiation'],
+    }
+
+
+def update_switch_ports(dashboard, serial, ports, cancel_event=None):
+    """
+    Updates the ports of one Meraki switch with one API call per port.
+
+    Args:
+        dashboard (meraki.DashboardAPI): Dashboard client to update with.
+        serial (str): Meraki switch serial number.
+        ports (list): Port configurations to apply.
+        cancel_event (threading.Event, optional): Checked before each port; once set,
+                                                  CancelledError is raised.
+    """
+    for port in ports:
+        raise_if_cancelled(cancel_event)
+        try:
+            dashboard.switch.updateDeviceSwitchPort(serial, portId=port['portId'], **build_port_update(port))
+            print(f"Updated port {port['portId']} on Meraki switch {serial}")
+        except meraki.APIError as e:
+            print(f"Error updating port {port['portId']} on Meraki switch {serial}: {e}")
+
+
+def update_switch_ports_in_batches(dashboard, organization_id, serial, ports, cancel_event=None):
+    """
+    Updates the ports of one Meraki switch through synchronous action batches.
+
+    Each batch applies up to MERAKI_ACTION_BATCH_SIZE port updates atomically in a single API call.
+
+    Args:
+        dashboard (meraki.DashboardAPI): Dashboard client to update with.
+        organization_id (str): Organization owning the switch.
+        serial (str): Meraki switch serial number.
+        ports (list): Port configurations to apply.
+        cancel_event (threading.Event, optional): Checked before each batch; once set,
+                                                  CancelledError is raised.
+    """
+    for start in range(0, len(ports), MERAKI_ACTION_BATCH_SIZE):
+        raise_if_cancelled(cancel_event)
+        batch_ports = ports[start:start + MERAKI_ACTION_BATCH_SIZE]
+        batch_port_ids = [str(port['portId']) for port in batch_ports]
+        port_ids = ', '.join(batch_port_ids)
+        actions = [
+            dashboard.batch.switch.updateDeviceSwitchPort(serial, port_id, **build_port_update(port))
+            for port_id, port in zip(batch_port_ids, batch_ports)
+        ]
+        try:
+            action_batch = dashboard.organizations.createOrganizationActionBatch(
+                organization_id, actions, confirmed=True, synchronous=True
+            )
+        except meraki.APIError as e:
+            print(f"Error updating ports {port_ids} on Meraki switch {serial}: {e}")
+            continue
+
+        status = action_batch.get('status', {})
+        if status.get('failed'):
+            print(f"Error updating ports {port_ids} on Meraki switch {serial}: {status.get('errors')}")
+        else:
+            print(f"Updated ports {port_ids} on Meraki switch {serial}")
+
+
+def configure_meraki_switch_ports(api_key, meraki_ports_map, organization_id=None, cancel_event=None):
     """
     Configures Meraki switch ports (stacked switches included) using the Meraki Dashboard API.
 
+    Switches are configured concurrently. Port updates are submitted as action batches when the
+    organization can be resolved, otherwise one call is made per port.
+
     Args:
         api_key (str): API key for authenticating with the Meraki Dashboard.
         meraki_ports_map (dict): A dictionary where keys are Meraki serial numbers and values are lists of port configurations.
+        organization_id (str, optional): Organization owning the switches, used for action batches.
+        cancel_event (threading.Event, optional): Once set, no further ports or batches are
+                                                  submitted and CancelledError is raised.
     """
-    dashboard = meraki.DashboardAPI(api_key)
+    dashboard = get_dashboard(api_key, suppress_logging=False)
 
-    for serial, ports in meraki_ports_map.items():
-        try:
-            existing_ports = dashboard.switch.getDeviceSwitchPorts(serial)
-            existing_port_ids = [str(port['portId']) for port in existing_ports]
-        except meraki.APIError as e:
-            print(f"Error retrieving existing ports for switch {serial}: {e}")
-            sys.exit(1)
+    with ContextThreadPoolExecutor(max_workers=MERAKI_MAX_WORKERS) as executor:
+        existing_ports_futures = {
+            serial: executor.submit(get_existing_port_ids, dashboard, api_key, serial)
+            for serial in meraki_ports_map
+        }
 
-        for port in ports:
-            if str(port['portId']) not in existing_port_ids:
-                print(f"Port {port['portId']} does not exist on the Meraki switch {serial}.")
-                continue
+        ports_to_update = {}
+        for serial, ports in meraki_ports_map.items():
             try:
-                dashboard.switch.updateDeviceSwitchPort(
-                    serial,
-                    portId=port['portId'],
-                    name=port['name'],
-                    tags=None,
-                    enabled=port['enabled'],
-                    type=port['type'],
-                    vlan=int(port['vlan']),
-                    voiceVlan=int(port['voiceVlan']) if port['voiceVlan'] else None,
-                    allowedVlans=port['allowedVlans'] if port['type'] == 'trunk' else '1-1000',
-                    poeEnabled=port['poeEnabled'],
-                    isolationEnabled=port['isolationEnabled'],
-                    rstpEnabled=port['rstpEnabled'],
-                    stpGuard=port['stpGuard'],
-                    linkNegotiation=port['linkNegotiation']
-                )
-                print(f"Updated port {port['portId']} on Meraki switch {serial}")
+                existing_port_ids = existing_ports_futures[serial].result()
             except meraki.APIError as e:
-                print(f"Error updating port {port['portId']} on Meraki switch {serial}: {e}")
+                print(f"Error retrieving existing ports for switch {serial}: {e}")
+                sys.exit(1)
+
+            ports_to_update[serial] = []
+            for port in ports:
+                port_id = str(port['portId'])
+                if port_id not in existing_port_ids:
+                    print(f"Port {port_id} does not exist on the Meraki switch {serial}.")
+                    continue
+                ports_to_update[serial].append(port)
+
+        organization_id = get_organization_id(dashboard, api_key, organization_id)
+        if organization_id is None:
+            print("Meraki organization could not be determined; updating ports individually.")
+
+        raise_if_cancelled(cancel_event)
+        futures = []
+        for serial, ports in ports_to_update.items():
+            if not ports:
+                continue
+            if organization_id is None:
+                futures.append(executor.submit(update_switch_ports, dashboard, serial, ports, cancel_event))
+            else:
+                futures.append(executor.submit(
+                    update_switch_ports_in_batches, dashboard, organization_id, serial, ports, cancel_event
+                ))
+
+        for future in futures:
+            future.result()
 
 
 def valid_interface(switch_number, port_number, meraki_serials, intf_name, is_one_based):
@@ -116,19 +249,30 @@ def map_interface_configs(interfaces, meraki_serials, access_group_number=0):
     """
     meraki_ports_map = {serial: [] for serial in meraki_serials}
 
-    detected = InterfaceParser.detect_format(list(interfaces.keys()))
-    if detected:
+    # Parse every name once, counting formats as we go; format_from_counts then applies
+    # detect_format's rules without a second pass
+    parsed_interfaces = []
+    three_part_count = 0
+    two_part_count = 0
+    for intf_name, catalyst_port_config in interfaces.items():
+        parsed = parse_interface_auto(intf_name)
+        if parsed is None:
+            continue
+        if parsed[0] == FormatType.THREE_PART.value:
+            three_part_count += 1
+        else:
+            two_part_count += 1
+        parsed_interfaces.append((intf_name, parsed, catalyst_port_config))
+
+    detected = format_from_counts(three_part_count, two_part_count)
+    if detected is not None:
         print(f"Auto-detected interface format: {detected.format_type.value} "
               f"(3-part: {detected.three_part_count}, 2-part: {detected.two_part_count})")
     else:
         print("No Ethernet interfaces detected in configuration.")
 
-    for intf_name, catalyst_port_config in interfaces.items():
-        parsed = InterfaceParser.parse_interface_auto(intf_name)
-        if parsed is None:
-            continue
-
-        if parsed[0] == 'three_part':
+    for intf_name, parsed, catalyst_port_config in parsed_interfaces:
+        if parsed[0] == FormatType.THREE_PART.value:
             _, switch_number, group_number, port_number = parsed
 
             if group_number != access_group_number:
@@ -156,7 +300,7 @@ def map_interface_configs(interfaces, meraki_serials, access_group_number=0):
 
 def run(meraki_api_key, meraki_cloud_ids, catalyst_ip=None,
         catalyst_config=None, access_group_number=0,
-        credentials_list=None, **kwargs):
+        credentials_list=None, organization_id=None, cancel_event=None, **kwargs):
     """
     Main execution function for converting Catalyst switch configuration
     to Meraki. Interface format is auto-detected from the config.
@@ -168,6 +312,9 @@ def run(meraki_api_key, meraki_cloud_ids, catalyst_ip=None,
         catalyst_config (str, optional): Pre-loaded config text.
         access_group_number (int): Access group number (default 0).
         credentials_list (list, optional): Credential dicts for Netmiko.
+        organization_id (str, optional): Meraki organization ID used to batch port updates.
+        cancel_event (threading.Event, optional): Set to stop before the next Meraki port update
+                                                  or batch; CancelledError is then raised.
         **kwargs: Accepts deprecated params (e.g. device_type).
 
     Returns:
@@ -194,7 +341,7 @@ def run(meraki_api_key, meraki_cloud_ids, catalyst_ip=None,
         print(f"Catalyst configuration retrieved from {hostname}.")
 
     interfaces = parse_interfaces(catalyst_config)
-    print(f"Parsed {len(interfaces)} interfaces from configuration.")
+    print(f"Parsed {len(interfaces)} Ethernet interfaces from configuration.")
 
     meraki_ports_map = map_interface_configs(
         interfaces,
@@ -208,7 +355,8 @@ def run(meraki_api_key, meraki_cloud_ids, catalyst_ip=None,
     print(f"Mapped {total_ports} Catalyst interfaces to Meraki "
           f"port configurations.")
 
-    configure_meraki_switch_ports(meraki_api_key, meraki_ports_map)
+    raise_if_cancelled(cancel_event)
+    configure_meraki_switch_ports(meraki_api_key, meraki_ports_map, organization_id, cancel_event)
     print("Port configurations applied to Meraki switches.")
 
 
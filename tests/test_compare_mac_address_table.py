@@ -0,0 +1,38 @@
+from scripts.compare_mac_address_table import clean_mac, compare_mac_addresses
+
+
+def _client(mac, switchport, vlan):
+    # Fields added by get_meraki_clients
+    return {
+        'mac': mac,
+        'switchport': switchport,
+        'vlan': vlan,
+        '_clean_mac': clean_mac(mac),
+        '_switchport': str(switchport),
+    }
+
+
+def _entry(port_id, mac):
+    return {
+        'catalyst_port': f'GigabitEthernet1/0/{port_id}',
+        'meraki_serial': 'Q2XX-0001',
+        'meraki_port_id': port_id,
+        'vlan': '10',
+        'mac': mac,
+    }
+
+
+def test_found_client_without_vlan_keeps_none():
+    mapping = [_entry(1, 'aabb.cc00.0001'), _entry(2, 'aabb.cc00.0002'), _entry(3, 'aabb.cc00.0003')]
+    meraki_clients = {
+        'Q2XX-0001': [
+            _client('aa:bb:cc:00:00:01', '1', None),
+            _client('aa:bb:cc:00:00:02', '5', 10),
+        ]
+    }
+
+    results = compare_mac_addresses(mapping, meraki_clients)
+
+    assert results['Meraki_VLAN'].tolist() == [None, 10, 'N/A']
+    assert results['Meraki_PortId'].tolist() == ['1', '5', 'N/A']
+    assert results['Status'].tolist() == ['Match', 'Port Mismatch', 'Not Found in Meraki']
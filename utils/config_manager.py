@@ -6,25 +6,45 @@ avoiding any dependency on OS-level environment variables.
 
 import os
 import json
+from typing import Optional
 
 _CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".catalyst_meraki_tool")
 _CONFIG_FILE = os.path.join(_CONFIG_DIR, "config.json")
 
+# Last parsed config and the file mtime it was read at; re-read only when the file changes
+_cache: Optional[dict] = None
+_cache_mtime: Optional[float] = None
+
 
 def _load() -> dict:
-    if os.path.exists(_CONFIG_FILE):
+    global _cache, _cache_mtime
+    try:
+        mtime = os.stat(_CONFIG_FILE).st_mtime
+    except OSError:
+        return {}
+
+    if _cache is None or mtime != _cache_mtime:
         try:
             with open(_CONFIG_FILE, "r") as f:
-                return json.load(f)
+                data = json.load(f)
         except Exception:
-            pass
-    return {}
+            return {}
+        _cache, _cache_mtime = data, mtime
+
+    return dict(_cache)
 
 
 def _save(data: dict) -> None:
+    global _cache, _cache_mtime
     os.makedirs(_CONFIG_DIR, exist_ok=True)
-    with open(_CONFIG_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    # Write to a temp file and swap it in, so a crash mid-write can't leave a truncated config
+    tmp_file = _CONFIG_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, _CONFIG_FILE)
+    _cache, _cache_mtime = dict(data), os.stat(_CONFIG_FILE).st_mtime
 
 
 def get_api_key() -> str:
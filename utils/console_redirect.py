@@ -1,38 +1,140 @@
 """
 Console redirection utility for redirecting stdout to a tkinter Text widget.
+
+sys.stdout is replaced once by a router that sends each write to the console
+of the background task running in the current context, so concurrent tasks
+never share or swap the process-wide stream.
 """
 
-import tkinter as tk
+import contextvars
+import queue
+import sys
+
+from config.constants import CONSOLE_MAX_LINES, CONSOLE_DRAIN_INTERVAL_MS
+
+# Console receiving print() output in the current context; None writes to the original stdout
+_console = contextvars.ContextVar('console', default=None)
+
+
+class _ContextStdout:
+    """
+    Process-wide sys.stdout that forwards writes to the current context's console.
+    """
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, string):
+        console = _console.get()
+        if console is not None:
+            return console.write(string)
+        if self._stream is not None:
+            return self._stream.write(string)
+        return len(string)
+
+    def flush(self):
+        console = _console.get()
+        if console is None and self._stream is not None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def install_stdout_router():
+    """Replace sys.stdout with the context router; later calls do nothing."""
+    if not isinstance(sys.stdout, _ContextStdout):
+        sys.stdout = _ContextStdout(sys.stdout)
+
+
+def use_console(console):
+    """
+    Send print() output in the current context to console.
+
+    Args:
+        console: A ConsoleRedirector, or None for the original stdout
+
+    Returns:
+        contextvars.Token: Token for restore_console()
+    """
+    return _console.set(console)
+
+
+def restore_console(token):
+    """Undo the use_console() call that returned token."""
+    _console.reset(token)
+
 
 class ConsoleRedirector:
     """
     Class to redirect stdout to a tkinter Text widget.
 
-    This is useful for displaying console output in the GUI.
+    This is useful for displaying console output in the GUI. write() may be
+    called from any thread and only queues the text; the Tk main thread drains
+    the queue every CONSOLE_DRAIN_INTERVAL_MS and inserts everything queued
+    with a single insert and scroll, since Tk is not thread-safe and each widget
+    update is expensive. Only the last CONSOLE_MAX_LINES lines are kept in the
+    widget, and a larger burst is trimmed before it is inserted.
     """
     def __init__(self, text_widget):
         """
-        Initialize the redirector.
+        Initialize the redirector. Must be called on the Tk main thread.
 
         Args:
             text_widget: A tkinter Text or ScrolledText widget
         """
         self.text_widget = text_widget
-        self.buffer = ""
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        text_widget.after(CONSOLE_DRAIN_INTERVAL_MS, self.drain)
 
     def write(self, string):
         """
-        Write a string to the text widget.
+        Queue a string for the text widget.
 
         Args:
             string: The string to write
         """
-        self.buffer += string
-        self.text_widget.insert(tk.END, string)
-        self.text_widget.see(tk.END)
+        self._queue.put(string)
+        return len(string)
 
     def flush(self):
         """
-        Flush the buffer. Required for stdout redirection.
+        Required for stdout redirection; queued text is inserted by the next drain.
         """
-        self.text_widget.update_idletasks()
+
+    def close(self):
+        """Stop draining once everything written so far has been inserted."""
+        self._closed = True
+
+    def drain(self):
+        """
+        Insert all queued output into the text widget. Runs on the Tk main thread.
+        """
+        widget = self.text_widget
+        if not widget.winfo_exists():
+            return
+
+        # Read before draining: anything written before close() is already queued
+        closed = self._closed
+        chunks = []
+        get = self._queue.get_nowait
+        while True:
+            try:
+                chunks.append(get())
+            except queue.Empty:
+                break
+
+        if chunks:
+            text = ''.join(chunks)
+            # A burst longer than the line limit would be deleted right after
+            # inserting it, so only its tail goes to the widget
+            if text.count('\n') > CONSOLE_MAX_LINES:
+                text = '\n'.join(text.rsplit('\n', CONSOLE_MAX_LINES)[1:])
+            widget.insert('end', text)
+            line_count = int(widget.index('end-1c').split('.')[0])
+            if line_count > CONSOLE_MAX_LINES:
+                widget.delete('1.0', f'end-{CONSOLE_MAX_LINES} lines')
+            widget.see('end')
+
+        if not closed:
+            widget.after(CONSOLE_DRAIN_INTERVAL_MS, self.drain)
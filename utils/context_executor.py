@@ -0,0 +1,105 @@
+"""
+Thread pool that runs each task in the submitting thread's context, and the
+cancellation check shared by long-running tasks.
+"""
+
+import contextvars
+import queue
+import threading
+from concurrent.futures import CancelledError, Executor, Future
+
+
+def raise_if_cancelled(cancel_event):
+    """Raise CancelledError if cancel_event is set; a None event never cancels."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise CancelledError()
+
+
+class ContextThreadPoolExecutor(Executor):
+    """
+    Executor whose tasks see the submitter's context variables and run on daemon threads.
+
+    New threads start with an empty context, so without this a background
+    task's helper threads would lose its console and print to the terminal
+    instead of the task's console widget.
+
+    concurrent.futures.ThreadPoolExecutor joins its workers at interpreter exit,
+    which would keep the application open until a long-running device or Meraki
+    task finished. These workers are daemon threads, so closing the window still
+    ends the process immediately.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix='pool'):
+        """
+        Initialize the executor. Worker threads are started as tasks are submitted.
+
+        Args:
+            max_workers: Maximum number of worker threads
+            thread_name_prefix: Prefix for the worker thread names
+        """
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._tasks = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._threads = []
+        self._shutdown = False
+        self._lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Schedule fn(*args, **kwargs) in a copy of the current context and return its Future."""
+        context = contextvars.copy_context()
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            self._tasks.put((future, context, fn, args, kwargs))
+
+            # Start another worker only when none is idle and the pool is below its limit
+            if not self._idle.acquire(blocking=False) and len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self._thread_name_prefix}-{len(self._threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        """
+        Stop the workers once the queued tasks have run.
+
+        Args:
+            wait: Wait for the workers to finish
+            cancel_futures: Cancel tasks that have not started yet
+        """
+        with self._lock:
+            if cancel_futures:
+                while True:
+                    try:
+                        task = self._tasks.get_nowait()
+                    except queue.Empty:
+                        break
+                    if task is not None:
+                        task[0].cancel()
+            if not self._shutdown or cancel_futures:
+                # One stop marker per worker, queued behind any remaining tasks
+                for _ in self._threads:
+                    self._tasks.put(None)
+            self._shutdown = True
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            future, context, fn, args, kwargs = task
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(context.run(fn, *args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+            self._idle.release()
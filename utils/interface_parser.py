@@ -3,10 +3,14 @@ Interface Parser Utility
 
 Centralizes interface name parsing patterns for different Catalyst switch models.
 Consolidates regex patterns scattered across multiple script files.
+
+The parsing functions are available both as InterfaceParser static methods and
+as module-level functions of the same name.
 """
 
 import re
 from enum import Enum
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
@@ -27,13 +31,49 @@ ETHERNET_PREFIXES = (
     'Fa',
 )
 
-_PREFIX_GROUP = '(?:' + '|'.join(ETHERNET_PREFIXES) + ')'
+_PREFIX_ALTERNATION = '|'.join(ETHERNET_PREFIXES)
+_PREFIX_GROUP = '(?:' + _PREFIX_ALTERNATION + ')'
+
+# Captures the Ethernet prefix in one anchored match; alternation order matches
+# ETHERNET_PREFIXES, so the longest prefix wins
+PATTERN_PREFIX = re.compile('(' + _PREFIX_ALTERNATION + ')')
+
+# Named number groups shared by the compiled patterns below
+_SWITCH_GROUP = r'(?P<switch>\d+)'
+_MODULE_GROUP = r'(?P<module>\d+)'
+_PORT_GROUP = r'(?P<port>\d+)'
 
 # 3-part: e.g. GigabitEthernet1/0/1
-PATTERN_THREE_PART = re.compile(_PREFIX_GROUP + r'(\d+)/(\d+)/(\d+)')
+PATTERN_THREE_PART = re.compile(_PREFIX_GROUP + _SWITCH_GROUP + '/' + _MODULE_GROUP + '/' + _PORT_GROUP)
 
 # 2-part: e.g. GigabitEthernet0/1 — $ anchor prevents partial match on 3-part names
-PATTERN_TWO_PART = re.compile(_PREFIX_GROUP + r'(\d+)/(\d+)$')
+PATTERN_TWO_PART = re.compile(_PREFIX_GROUP + _SWITCH_GROUP + '/' + _PORT_GROUP + '$')
+
+# Either format in a single match: 'module' is set only for 3-part names, and
+# 2-part names must end after the port, as in PATTERN_TWO_PART
+PATTERN_ETHERNET = re.compile(
+    _PREFIX_GROUP + _SWITCH_GROUP + '/(?:' + _MODULE_GROUP + '/)?' + _PORT_GROUP + '(?(module)|$)'
+)
+
+
+# Interface names repeat across comparisons of the same switches, so parse results are
+# cached per name.
+@lru_cache(maxsize=8192)
+def _parse_interface_auto(interface_name: str) -> Optional[Tuple]:
+    match = PATTERN_ETHERNET.match(interface_name)
+    if not match:
+        return None
+
+    module = match['module']
+    if module is not None:
+        return ('three_part', int(match['switch']), int(module), int(match['port']))
+    return ('two_part', int(match['switch']), int(match['port']))
+
+
+@lru_cache(maxsize=8192)
+def _interface_prefix(interface_name: str) -> Optional[str]:
+    match = PATTERN_PREFIX.match(interface_name)
+    return match.group(1) if match else None
 
 
 class FormatType(Enum):
@@ -61,42 +101,51 @@ class InterfaceParser:
     and port numbering schemes.
     """
 
-    # Interface patterns for different device types
-    PATTERNS = {
+    # Interface pattern sources for different device types; the port number is always the named 'port' group.
+    # parse_interface requires the whole name to match, so the patterns carry no end anchor
+    PATTERN_SOURCES = {
         # Catalyst 2960: GigabitEthernet<switch>/<group>/<port>
         # Example: GigabitEthernet1/0/1
-        'catalyst_2960': r'GigabitEthernet(\d+)/(\d+)/(\d+)',
+        'catalyst_2960': r'GigabitEthernet(\d+)/(\d+)/(?P<port>\d+)',
 
         # Catalyst 3850: GigabitEthernet<switch>/<port>
         # Example: GigabitEthernet1/1
-        'catalyst_3850': r'GigabitEthernet(\d+)/(\d+)',
+        'catalyst_3850': r'GigabitEthernet(\d+)/(?P<port>\d+)',
 
         # Generic pattern for comparison scripts: (Gi|Fa)<switch>/.../<port>
         # Matches both GigabitEthernet and FastEthernet abbreviated
         # Example: Gi1/0/1 or Fa2/0/24
-        'catalyst_generic': r'(Gi|Fa)(\d+)/\d+/(\d+)',
+        'catalyst_generic': r'(Gi|Fa)(\d+)/\d+/(?P<port>\d+)',
 
         # Full interface names for comparison
         # Example: GigabitEthernet1/0/1 or FastEthernet2/0/24
-        'catalyst_full_interface': r'(GigabitEthernet|FastEthernet)(\d+)/\d+/(\d+)',
+        'catalyst_full_interface': r'(GigabitEthernet|FastEthernet)(\d+)/\d+/(?P<port>\d+)',
+
+        # Full or abbreviated names in a single pass, used by the comparison scripts
+        # Example: GigabitEthernet1/0/1, Gi1/0/1 or Fa2/0/24
+        'catalyst_comparison': r'(GigabitEthernet|FastEthernet|Gi|Fa)(\d+)/\d+/(?P<port>\d+)',
     }
 
-    @classmethod
-    def parse_interface(cls, interface_name: str, device_type: str = 'catalyst_2960') -> Optional[Tuple]:
+    # Compiled once at import so matching skips the re module's pattern cache lookup
+    PATTERNS = {device_type: re.compile(source) for device_type, source in PATTERN_SOURCES.items()}
+
+    @staticmethod
+    def parse_interface(interface_name: str, device_type: str = 'catalyst_2960') -> Optional[Tuple]:
         """
         Parse interface name into its components.
 
         Args:
             interface_name (str): Full interface name (e.g., 'GigabitEthernet1/0/1')
             device_type (str): Device type key from PATTERNS dict.
-                              Options: 'catalyst_2960', 'catalyst_3850', 'catalyst_generic'
+                              Options: 'catalyst_2960', 'catalyst_3850', 'catalyst_generic',
+                              'catalyst_full_interface', 'catalyst_comparison'
                               Default: 'catalyst_2960'
 
         Returns:
             tuple: Parsed interface components, or None if parsing fails
                   - For 2960: (switch_number, group_number, port_number)
                   - For 3850: (switch_number, port_number)
-                  - For generic: (interface_type, switch_number, port_number)
+                  - For generic/full/comparison: (interface_type, switch_number, port_number)
 
         Example:
             >>> InterfaceParser.parse_interface('GigabitEthernet1/0/24', 'catalyst_2960')
@@ -108,19 +157,10 @@ class InterfaceParser:
             >>> InterfaceParser.parse_interface('Gi1/0/1', 'catalyst_generic')
             ('Gi', '1', '1')
         """
-        if device_type not in cls.PATTERNS:
-            raise ValueError(f"Unknown device type: {device_type}. "
-                           f"Valid types: {list(cls.PATTERNS.keys())}")
+        return _parse_interface(interface_name, device_type)
 
-        pattern = cls.PATTERNS[device_type]
-        match = re.match(pattern, interface_name)
-
-        if match:
-            return match.groups()
-        return None
-
-    @classmethod
-    def is_valid_interface(cls, interface_name: str, device_type: str = 'catalyst_2960') -> bool:
+    @staticmethod
+    def is_valid_interface(interface_name: str, device_type: str = 'catalyst_2960') -> bool:
         """
         Check if interface name matches expected pattern for device type.
 
@@ -141,10 +181,10 @@ class InterfaceParser:
             >>> InterfaceParser.is_valid_interface('FastEthernet1/0/1', 'catalyst_2960')
             False
         """
-        return cls.parse_interface(interface_name, device_type) is not None
+        return InterfaceParser.parse_interface(interface_name, device_type) is not None
 
-    @classmethod
-    def extract_port_number(cls, interface_name: str, device_type: str = 'catalyst_2960') -> Optional[int]:
+    @staticmethod
+    def extract_port_number(interface_name: str, device_type: str = 'catalyst_2960') -> Optional[int]:
         """
         Extract just the port number from an interface name.
 
@@ -162,18 +202,15 @@ class InterfaceParser:
             >>> InterfaceParser.extract_port_number('GigabitEthernet2/10', 'catalyst_3850')
             10
         """
-        parsed = cls.parse_interface(interface_name, device_type)
+        parsed = _parse_interface(interface_name, device_type)
         if not parsed:
             return None
 
-        # Port number is always the last component
-        try:
-            return int(parsed[-1])
-        except (ValueError, IndexError):
-            return None
+        # The 'port' group is the last group in every pattern
+        return int(parsed[-1])
 
-    @classmethod
-    def detect_format(cls, interface_names: list) -> Optional[InterfaceFormat]:
+    @staticmethod
+    def detect_format(interface_names: list) -> Optional[InterfaceFormat]:
         """
         Scan all interface names and detect the dominant format.
 
@@ -187,11 +224,31 @@ class InterfaceParser:
         two_part_count = 0
 
         for name in interface_names:
-            if PATTERN_THREE_PART.match(name):
+            match = PATTERN_ETHERNET.match(name)
+            if match is None:
+                continue
+            if match['module'] is not None:
                 three_part_count += 1
-            elif PATTERN_TWO_PART.match(name):
+            else:
                 two_part_count += 1
 
+        return InterfaceParser.format_from_counts(three_part_count, two_part_count)
+
+    @staticmethod
+    def format_from_counts(three_part_count: int, two_part_count: int) -> Optional[InterfaceFormat]:
+        """
+        Build the detected format from counts of 3-part and 2-part interface names.
+
+        Lets callers that already parsed every name share detect_format's result
+        without a second pass. Ties go to the 3-part format.
+
+        Args:
+            three_part_count (int): Number of 3-part Ethernet interface names.
+            two_part_count (int): Number of 2-part Ethernet interface names.
+
+        Returns:
+            InterfaceFormat with detected format info, or None if both counts are zero.
+        """
         if three_part_count == 0 and two_part_count == 0:
             return None
 
@@ -212,12 +269,13 @@ class InterfaceParser:
                 two_part_count=two_part_count,
             )
 
-    @classmethod
-    def parse_interface_auto(cls, interface_name: str) -> Optional[Tuple]:
+    @staticmethod
+    def parse_interface_auto(interface_name: str) -> Optional[Tuple]:
         """
         Parse an interface name without requiring a device_type.
 
-        Tries 3-part first, then 2-part.
+        Matches both formats with one regex, so each name is scanned once;
+        results are cached per name.
 
         Args:
             interface_name (str): Full interface name.
@@ -227,20 +285,10 @@ class InterfaceParser:
             ('two_part', switch, port) for 2-part matches,
             or None if no match.
         """
-        match = PATTERN_THREE_PART.match(interface_name)
-        if match:
-            switch, group, port = match.groups()
-            return ('three_part', int(switch), int(group), int(port))
+        return _parse_interface_auto(interface_name)
 
-        match = PATTERN_TWO_PART.match(interface_name)
-        if match:
-            switch, port = match.groups()
-            return ('two_part', int(switch), int(port))
-
-        return None
-
-    @classmethod
-    def get_interface_prefix(cls, interface_name: str) -> Optional[str]:
+    @staticmethod
+    def get_interface_prefix(interface_name: str) -> Optional[str]:
         """
         Extract interface type prefix (GigabitEthernet, FastEthernet, etc.).
 
@@ -260,13 +308,10 @@ class InterfaceParser:
             >>> InterfaceParser.get_interface_prefix('FastEthernet2/0/24')
             'FastEthernet'
         """
-        for prefix in ETHERNET_PREFIXES:
-            if interface_name.startswith(prefix):
-                return prefix
-        return None
+        return _interface_prefix(interface_name)
 
-    @classmethod
-    def filter_interfaces(cls, interface_names: list, device_type: str = 'catalyst_2960',
+    @staticmethod
+    def filter_interfaces(interface_names: list, device_type: str = 'catalyst_2960',
                          include_prefixes: Optional[list] = None) -> list:
         """
         Filter list of interface names to only valid interfaces for device type.
@@ -289,18 +334,42 @@ class InterfaceParser:
             ...                                   include_prefixes=['GigabitEthernet'])
             ['GigabitEthernet1/0/1', 'GigabitEthernet1/0/2']
         """
-        filtered = []
-        for interface in interface_names:
-            # Check if valid for device type
-            if not cls.is_valid_interface(interface, device_type):
-                continue
-
-            # Check prefix filter if specified
-            if include_prefixes:
-                prefix = cls.get_interface_prefix(interface)
-                if prefix not in include_prefixes:
-                    continue
-
-            filtered.append(interface)
-
-        return filtered
+        match = _get_pattern(device_type).fullmatch
+
+        # Check validity for the device type, then the prefix filter if specified
+        if not include_prefixes:
+            return [interface for interface in interface_names if match(interface)]
+
+        allowed_prefixes = frozenset(include_prefixes)
+        return [
+            interface for interface in interface_names
+            if match(interface) and _interface_prefix(interface) in allowed_prefixes
+        ]
+
+
+# Module-level functions for hot loops: InterfaceParser's methods are staticmethods, so these
+# are the same plain functions without the class attribute lookup on every call
+parse_interface = InterfaceParser.parse_interface
+is_valid_interface = InterfaceParser.is_valid_interface
+extract_port_number = InterfaceParser.extract_port_number
+detect_format = InterfaceParser.detect_format
+format_from_counts = InterfaceParser.format_from_counts
+parse_interface_auto = InterfaceParser.parse_interface_auto
+get_interface_prefix = InterfaceParser.get_interface_prefix
+filter_interfaces = InterfaceParser.filter_interfaces
+
+
+def _get_pattern(device_type: str):
+    """Return the compiled pattern for device_type, raising ValueError if it is unknown."""
+    try:
+        return InterfaceParser.PATTERNS[device_type]
+    except KeyError:
+        raise ValueError(f"Unknown device type: {device_type}. "
+                         f"Valid types: {list(InterfaceParser.PATTERNS.keys())}") from None
+
+
+# The same names are parsed repeatedly across validation, filtering and port mapping
+@lru_cache(maxsize=4096)
+def _parse_interface(interface_name: str, device_type: str) -> Optional[Tuple]:
+    match = _get_pattern(device_type).fullmatch(interface_name)
+    return match.groups() if match else None
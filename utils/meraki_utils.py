@@ -0,0 +1,189 @@
+"""
+Meraki Dashboard Utilities
+
+Shared construction of Meraki Dashboard API clients for the comparison
+and conversion scripts, so rate-limit handling is configured in one place,
+plus concurrent per-switch fetching and a short-lived response cache for
+read-only lookups.
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import as_completed
+
+import meraki
+
+from config.constants import (
+    MERAKI_BASE_URL,
+    MERAKI_MAXIMUM_RETRIES,
+    MERAKI_429_RETRY_WAIT_TIME,
+    MERAKI_CACHE_TTL,
+    MERAKI_ORGANIZATION_CACHE_TTL,
+    MERAKI_CACHE_MAX_ENTRIES,
+    MERAKI_MAX_WORKERS,
+)
+from .context_executor import ContextThreadPoolExecutor, raise_if_cancelled
+
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def get_dashboard(api_key, suppress_logging=True):
+    """
+    Create a Meraki Dashboard API client with rate-limit aware retries.
+
+    On a 429 response the SDK sleeps for the server's Retry-After value
+    (falling back to a short randomized wait when the header is absent)
+    rather than a long fixed back-off. Requests go to the MERAKI_BASE_URL
+    environment variable if set, otherwise to the api-mp.meraki.com proxy.
+
+    Args:
+        api_key (str): The API key for authenticating with the Meraki Dashboard.
+        suppress_logging (bool): Suppress the SDK's log file and console output. Default: True
+
+    Returns:
+        meraki.DashboardAPI: Configured dashboard client.
+
+    Example:
+        >>> dashboard = get_dashboard(api_key)
+        >>> ports = dashboard.switch.getDeviceSwitchPortsStatuses(serial)
+    """
+    return meraki.DashboardAPI(
+        api_key,
+        base_url=os.getenv('MERAKI_BASE_URL', MERAKI_BASE_URL),
+        suppress_logging=suppress_logging,
+        wait_on_rate_limit=True,
+        maximum_retries=MERAKI_MAXIMUM_RETRIES,
+        nginx_429_retry_wait_time=MERAKI_429_RETRY_WAIT_TIME,
+    )
+
+
+def get_organization_id(dashboard, api_key, organization_id=None):
+    """
+    Resolve the organization to use for organization-wide endpoints.
+
+    The lookup result, including "no single organization", is cached per API key
+    for MERAKI_ORGANIZATION_CACHE_TTL, so repeated runs skip the getOrganizations() call.
+
+    Args:
+        dashboard (meraki.DashboardAPI): Dashboard client to query with.
+        api_key (str): API key the dashboard was created with, used as the cache key.
+        organization_id (str, optional): Explicit organization ID; returned unchanged if given.
+
+    Returns:
+        str: The organization ID, or None if it was not given and the API key
+             does not have access to exactly one organization.
+    """
+    if organization_id is not None:
+        return organization_id
+
+    try:
+        return get_cached(
+            ('organization_id', api_key),
+            lambda: _single_organization_id(dashboard),
+            ttl=MERAKI_ORGANIZATION_CACHE_TTL
+        )
+    except meraki.APIError as e:
+        print(f"Could not look up Meraki organizations: {e}")
+        return None
+
+
+def _single_organization_id(dashboard):
+    """Return the ID of the only organization the dashboard can see, or None."""
+    organizations = dashboard.organizations.getOrganizations()
+    if len(organizations) != 1:
+        return None
+    return organizations[0]['id']
+
+
+def fetch_for_serials(fetch, serials, description, cancel_event=None):
+    """
+    Call fetch(serial) for every switch concurrently.
+
+    Each switch is a separate round trip, so the calls run on a thread pool;
+    MERAKI_MAX_WORKERS keeps them within the Dashboard API's per-organization
+    rate limit, and the SDK backs off on any 429 that still occurs. The pool's
+    workers are daemon threads, so a slow or retrying call doesn't delay exit.
+
+    Args:
+        fetch (callable): Function taking a serial and returning its API response.
+        serials (list): Meraki switch serial numbers.
+        description (str): What is being fetched, used in error messages.
+        cancel_event (threading.Event, optional): Once set, switches not yet fetched are
+                                                  skipped and CancelledError is raised.
+
+    Returns:
+        dict: Serials, in the given order, mapped to fetch results; a switch whose
+              call raised meraki.APIError maps to an empty list.
+
+    Example:
+        >>> clients = fetch_for_serials(dashboard.devices.getDeviceClients, serials, 'clients')
+    """
+    results = {serial: [] for serial in serials}
+    def fetch_unless_cancelled(serial):
+        raise_if_cancelled(cancel_event)
+        return fetch(serial)
+
+    with ContextThreadPoolExecutor(max_workers=MERAKI_MAX_WORKERS) as executor:
+        futures = {executor.submit(fetch_unless_cancelled, serial): serial for serial in serials}
+        for future in as_completed(futures):
+            serial = futures[future]
+            try:
+                results[serial] = future.result()
+            except meraki.APIError as e:
+                print(f"Error retrieving {description} for Meraki switch {serial}: {e}")
+    return results
+
+
+def get_cached(key, fetch, ttl=MERAKI_CACHE_TTL):
+    """
+    Return a recent cached response for key, or call fetch() and cache its result.
+
+    Entries expire after ttl seconds and the cache is bounded to
+    MERAKI_CACHE_MAX_ENTRIES, evicting the least recently used entry.
+    Exceptions raised by fetch() propagate and nothing is cached.
+
+    Args:
+        key (tuple): Cache key, e.g. ('clients', api_key, serial).
+        fetch (callable): Zero-argument function performing the API call.
+        ttl (float): Seconds a cached response stays valid. Default: MERAKI_CACHE_TTL
+
+    Returns:
+        The cached or freshly fetched response.
+
+    Example:
+        >>> clients = get_cached(('clients', api_key, serial),
+        ...                      lambda: dashboard.devices.getDeviceClients(serial))
+    """
+    now = time.monotonic()
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            _response_cache.move_to_end(key)
+            return entry[1]
+
+    value = fetch()
+
+    with _response_cache_lock:
+        _response_cache[key] = (now, value)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > MERAKI_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+    return value
+
+
+def clear_cached(key=None):
+    """
+    Drop a cached response, or the whole cache if no key is given.
+
+    Args:
+        key (tuple, optional): Cache key to invalidate. Default: None (clear everything)
+    """
+    with _response_cache_lock:
+        if key is None:
+            _response_cache.clear()
+        else:
+            _response_cache.pop(key, None)
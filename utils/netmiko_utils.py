@@ -13,7 +13,7 @@ Environment Variables:
     NETMIKO_DEFAULT_READ_TIMEOUT            - Read timeout override (default: 120)
 
 Usage Example:
-    from netmiko_utils import connect_with_retry, save_config_to_folder, configure_logging
+    from netmiko_utils import connect_with_retry, connect_many, save_config_to_folder, configure_logging
 
     logger = configure_logging('my_script.log')
     net_connect, cred = connect_with_retry('192.168.1.1', logger=logger)
@@ -22,12 +22,71 @@ Usage Example:
         with net_connect:
             net_connect.enable()
             save_config_to_folder(net_connect, './configs')
+
+    for ip, net_connect, cred in connect_many(['192.168.1.1', '192.168.1.2'], logger=logger):
+        if net_connect:
+            with net_connect:
+                save_config_to_folder(net_connect, './configs')
 """
 
 import os
+import re
+import sys
 import logging
 import getpass
-from netmiko import ConnectHandler, NetMikoTimeoutException, NetMikoAuthenticationException
+import threading
+import time
+from functools import lru_cache
+from concurrent.futures import as_completed
+from netmiko import ConnectHandler, NetMikoTimeoutException, NetMikoAuthenticationException, ReadTimeout
+
+from .context_executor import ContextThreadPoolExecutor
+
+# Interactive credential entered on the first load_credentials_from_env() call
+_interactive_credential = None
+_interactive_credential_lock = threading.Lock()
+
+_ENV_USERNAME = re.compile(r'NETMIKO_USERNAME_(\d+)$')
+
+
+def _prompt_for_credential():
+    """
+    Prompt for the current user's password once per process.
+
+    Returns the same credential on later calls so connecting to many hosts does
+    not prompt again. Returns None without prompting when stdin is not a terminal.
+    """
+    global _interactive_credential
+    with _interactive_credential_lock:
+        if _interactive_credential is None:
+            if not (sys.stdin and sys.stdin.isatty()):
+                return None
+            try:
+                username = getpass.getuser()
+                password = getpass.getpass("Password: ")
+                _interactive_credential = {'username': username, 'password': password}
+            except Exception as e:
+                logging.warning(f"Could not get user credentials interactively: {e}")
+                return None
+        return dict(_interactive_credential)
+
+
+@lru_cache(maxsize=1)
+def _credentials_from_env():
+    """Collect NETMIKO_USERNAME_N / NETMIKO_PASSWORD_N pairs once per process, in index order."""
+    usernames = {}
+    for key, value in os.environ.items():
+        match = _ENV_USERNAME.match(key)
+        if match:
+            usernames[int(match.group(1))] = value
+
+    # Numbering starts at 1 and stops at the first index without a complete pair
+    credentials = []
+    index = 1
+    while usernames.get(index) and os.environ.get(f'NETMIKO_PASSWORD_{index}'):
+        credentials.append((usernames[index], os.environ[f'NETMIKO_PASSWORD_{index}']))
+        index += 1
+    return tuple(credentials)
 
 
 def load_credentials_from_env(include_user_prompt=True):
@@ -39,9 +98,13 @@ def load_credentials_from_env(include_user_prompt=True):
     - NETMIKO_USERNAME_2, NETMIKO_PASSWORD_2
     - etc.
 
+    The environment is read once per process, and the interactive password is
+    asked for at most once; later calls reuse both.
+
     Args:
         include_user_prompt (bool): If True, prepends interactive user prompt as first credential.
                                    Uses getpass.getuser() and getpass.getpass() for secure input.
+                                   Skipped when stdin is not a terminal.
                                    Default: True
 
     Returns:
@@ -56,23 +119,14 @@ def load_credentials_from_env(include_user_prompt=True):
     credentials = []
 
     if include_user_prompt:
-        try:
-            username = getpass.getuser()
-            password = getpass.getpass("Password: ")
-            credentials.append({'username': username, 'password': password})
-        except Exception as e:
-            logging.warning(f"Could not get user credentials interactively: {e}")
+        credential = _prompt_for_credential()
+        if credential:
+            credentials.append(credential)
 
-    index = 1
-    while True:
-        username = os.getenv(f'NETMIKO_USERNAME_{index}')
-        password = os.getenv(f'NETMIKO_PASSWORD_{index}')
-
-        if username and password:
-            credentials.append({'username': username, 'password': password})
-            index += 1
-        else:
-            break
+    credentials.extend(
+        {'username': username, 'password': password}
+        for username, password in _credentials_from_env()
+    )
 
     if not credentials:
         logging.warning("No credentials loaded. Set NETMIKO_USERNAME_N and NETMIKO_PASSWORD_N environment variables.")
@@ -191,6 +245,56 @@ def connect_with_retry(ip_address, credentials=None, device_type='cisco_ios',
         return None, None
 
 
+def connect_many(ip_addresses, credentials=None, max_workers=16, logger=None, **kwargs):
+    """
+    Connect to several network devices concurrently.
+
+    SSH handshakes are network-bound, so running connect_with_retry() for each
+    device on a thread pool overlaps their round trips instead of paying them
+    one after another. The pool's workers are daemon threads, so a login still
+    in progress doesn't delay exit. Credentials are loaded once, before any
+    thread starts, so the interactive password prompt is shown at most once.
+
+    Args:
+        ip_addresses (list): Device IP addresses or hostnames
+        credentials (list, optional): List of credential dicts shared by all devices.
+                                     If None, loads from environment using load_credentials_from_env().
+        max_workers (int): Maximum number of simultaneous connection attempts. Default: 16
+        logger (logging.Logger, optional): Logger shared by all workers. If None, uses module logger.
+        **kwargs: Additional keyword arguments passed to connect_with_retry()
+                  (device_type, enable_secret, timeout, read_timeout_override, log_auth_failures).
+
+    Yields:
+        tuple: (ip_address, net_connect, successful_credential) for each device as its
+               connection attempt finishes; net_connect and successful_credential are None on failure
+
+    Example:
+        >>> for ip, net_connect, cred in connect_many(['10.0.0.1', '10.0.0.2']):
+        ...     if net_connect:
+        ...         with net_connect:
+        ...             print(ip, net_connect.find_prompt())
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    if credentials is None:
+        credentials = load_credentials_from_env(include_user_prompt=True)
+
+    with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(connect_with_retry, ip_address, credentials=credentials, logger=logger, **kwargs): ip_address
+            for ip_address in ip_addresses
+        }
+        for future in as_completed(futures):
+            ip_address = futures[future]
+            try:
+                net_connect, credential = future.result()
+            except Exception as error:
+                logger.error(f"Failed to connect to {ip_address}: {error}")
+                net_connect, credential = None, None
+            yield ip_address, net_connect, credential
+
+
 def save_config_to_folder(net_connect, base_folder_path,
                           location_delimiter='-', location_index=0):
     """
@@ -218,7 +322,9 @@ def save_config_to_folder(net_connect, base_folder_path,
         >>> save_config_to_folder(net_connect, './configs', location_delimiter='_')
         './configs/SITE/SITE_DEVICE_01_config.txt'
     """
-    device_name = net_connect.find_prompt()[:-1]
+    # Read once: the prompt names the device and marks the end of the streamed output
+    prompt = net_connect.find_prompt()
+    device_name = prompt[:-1]
 
     try:
         location = device_name.split(location_delimiter)[location_index]
@@ -227,15 +333,25 @@ def save_config_to_folder(net_connect, base_folder_path,
         logging.warning(f"Could not parse location from {device_name}, using full name as location")
 
     folder_path = os.path.join(base_folder_path, location)
-    if not os.path.exists(folder_path):
-        os.makedirs(folder_path)
+    os.makedirs(folder_path, exist_ok=True)
 
     file_path = os.path.join(folder_path, f"{device_name}_config.txt")
 
-    running_config = net_connect.send_command('show run')
-
-    with open(file_path, 'w') as file:
-        file.write(running_config)
+    # Stream into a temporary file and move it into place only once the whole
+    # config has arrived, so a timeout or dropped session never leaves a
+    # truncated file that looks like a valid backup
+    temp_path = file_path + '.tmp'
+    try:
+        with open(temp_path, 'w', buffering=65536) as file:
+            for chunk in _stream_command_output(net_connect, 'show run', prompt):
+                file.write(chunk)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
 
     print(f"Configuration saved for {device_name} in {file_path}")
     logging.info(f"Configuration saved for {device_name} in {file_path}")
@@ -243,6 +359,79 @@ def save_config_to_folder(net_connect, base_folder_path,
     return file_path
 
 
+def _stream_command_output(net_connect, command, prompt, read_timeout=120):
+    """
+    Send a command and yield its output in chunks as it arrives.
+
+    Lets large outputs such as the running config be written to disk without
+    holding the whole text in memory. Like send_command(), the connection's
+    read_timeout_override takes precedence over read_timeout, linefeeds are
+    normalized, ANSI escape codes are removed and the echoed command and the
+    trailing prompt are stripped. Falls back to send_command() for connections
+    without raw channel access.
+
+    Args:
+        net_connect: Active Netmiko connection object
+        command (str): Command to execute
+        prompt (str): Device prompt that marks the end of the output
+        read_timeout (int): Seconds to wait for the prompt, unless the connection
+                            sets read_timeout_override. Default: 120
+
+    Yields:
+        str: Consecutive chunks of command output
+
+    Raises:
+        ReadTimeout: If the prompt is not seen within read_timeout seconds
+    """
+    if not hasattr(net_connect, 'read_channel'):
+        yield net_connect.send_command(command, read_timeout=read_timeout)
+        return
+
+    if getattr(net_connect, 'read_timeout_override', None):
+        read_timeout = net_connect.read_timeout_override
+
+    net_connect.clear_buffer()
+    net_connect.write_channel(command + net_connect.RETURN)
+
+    # Hold back enough of the tail to recognise a prompt split across reads
+    hold_back = len(prompt) + 2
+    pending = ''
+    carry = ''
+    echo_stripped = False
+    deadline = time.monotonic() + read_timeout
+
+    while time.monotonic() < deadline:
+        data = net_connect.read_channel()
+        if not data:
+            time.sleep(0.05)
+            continue
+
+        # Same clean-up as send_command(). A trailing '\r' is kept back until the
+        # next read so a '\r\n' split across two reads becomes a single newline
+        data = carry + data
+        carry = ''
+        if data.endswith('\r'):
+            data, carry = data[:-1], '\r'
+        pending += net_connect.strip_ansi_escape_codes(net_connect.normalize_linefeeds(data))
+
+        if not echo_stripped:
+            if '\n' not in pending:
+                continue
+            pending = pending.split('\n', 1)[1]
+            echo_stripped = True
+
+        stripped = pending.rstrip()
+        if stripped.endswith(prompt):
+            yield stripped[:-len(prompt)]
+            return
+
+        if len(pending) > hold_back:
+            yield pending[:-hold_back]
+            pending = pending[-hold_back:]
+
+    raise ReadTimeout(f"Prompt {prompt!r} not found after {read_timeout}s running {command!r}")
+
+
 def configure_logging(log_filename='netmiko_automation.log',
                       log_level=logging.WARNING,
                       log_format='%(asctime)s %(levelname)s:%(message)s'):
@@ -8,6 +8,31 @@ Consolidates duplicate port configuration logic from conversion scripts.
 import re
 from typing import Dict, Any
 
+from config.constants import DEFAULT_MERAKI_PORT_CONFIG
+
+# One alternative per supported interface directive; each has a single named group so
+# match.lastgroup identifies which directive a line holds
+_PORT_DIRECTIVE = re.compile(
+    r'^\s*(?:'
+    r'description (?P<description>.+)'
+    r'|switchport mode (?P<trunk>trunk)'
+    r'|switchport trunk allowed vlan (?P<allowed_vlans>.+)'
+    r'|switchport trunk native vlan (?P<native_vlan>\d+)'
+    r'|switchport access vlan (?P<access_vlan>\d+)'
+    r'|switchport voice vlan (?P<voice_vlan>\d+)'
+    r'|spanning-tree (?P<portfast>portfast)'
+    r'|spanning-tree (?P<bpdu_guard>bpduguard enable)'
+    r'|spanning-tree guard (?P<root_guard>root)'
+    r'|power inline (?P<poe_never>never)'
+    r'|(?P<shutdown>shutdown)\s*$'
+    r')',
+    re.MULTILINE
+)
+
+# Meraki settings for a port with no matching directives; copied per port and updated
+# from its config
+_DEFAULT_MERAKI_PORT = {'name': None, **DEFAULT_MERAKI_PORT_CONFIG}
+
 
 def build_meraki_port_config(port_number: int, catalyst_port_config: str) -> Dict[str, Any]:
     """
@@ -50,61 +75,46 @@ def build_meraki_port_config(port_number: int, catalyst_port_config: str) -> Dic
         >>> print(config['voiceVlan'])
         '20'
     """
-    meraki_port_config = {
-        'portId': port_number,
-        'name': None,
-        'enabled': True,
-        'type': 'access',
-        'vlan': '1',
-        'voiceVlan': None,
-        'allowedVlans': '1-1000',
-        'poeEnabled': True,
-        'isolationEnabled': False,
-        'rstpEnabled': True,
-        'stpGuard': 'disabled',
-        'linkNegotiation': 'Auto negotiate',
-    }
-
-    if 'shutdown' in catalyst_port_config:
+    meraki_port_config = _DEFAULT_MERAKI_PORT.copy()
+    meraki_port_config['portId'] = port_number
+
+    # First occurrence of each directive, collected in a single pass over the config
+    directives = {}
+    for match in _PORT_DIRECTIVE.finditer(catalyst_port_config):
+        directives.setdefault(match.lastgroup, match[match.lastgroup])
+
+    if 'shutdown' in directives:
         meraki_port_config['enabled'] = False
 
-    if 'description' in catalyst_port_config:
-        description_match = re.search(r'description (.+)', catalyst_port_config)
-        if description_match:
-            meraki_port_config['name'] = description_match.group(1).strip()
+    if 'description' in directives:
+        meraki_port_config['name'] = directives['description'].strip()
 
-    if 'switchport mode trunk' in catalyst_port_config:
+    if 'trunk' in directives:
         meraki_port_config['type'] = 'trunk'
 
-        allowed_vlans = re.search(r'switchport trunk allowed vlan (.+)', catalyst_port_config)
-        if allowed_vlans:
-            meraki_port_config['allowedVlans'] = allowed_vlans.group(1).strip()
-        else:
-            meraki_port_config['allowedVlans'] = '1-1000'
+        if 'allowed_vlans' in directives:
+            meraki_port_config['allowedVlans'] = directives['allowed_vlans'].strip()
 
-        native_vlan = re.search(r'switchport trunk native vlan (\d+)', catalyst_port_config)
-        if native_vlan:
-            meraki_port_config['vlan'] = native_vlan.group(1)
+        if 'native_vlan' in directives:
+            meraki_port_config['vlan'] = directives['native_vlan']
 
     else:
-        access_vlan = re.search(r'switchport access vlan (\d+)', catalyst_port_config)
-        if access_vlan:
-            meraki_port_config['vlan'] = access_vlan.group(1)
+        if 'access_vlan' in directives:
+            meraki_port_config['vlan'] = directives['access_vlan']
 
-        voice_vlan = re.search(r'switchport voice vlan (\d+)', catalyst_port_config)
-        if voice_vlan:
-            meraki_port_config['voiceVlan'] = voice_vlan.group(1)
+        if 'voice_vlan' in directives:
+            meraki_port_config['voiceVlan'] = directives['voice_vlan']
 
-    if 'spanning-tree portfast' in catalyst_port_config:
+    if 'portfast' in directives:
         meraki_port_config['rstpEnabled'] = True
 
-    if 'spanning-tree bpduguard enable' in catalyst_port_config:
-        meraki_port_config['stpGuard'] = 'bpdu guard'
-
-    if 'spanning-tree guard root' in catalyst_port_config:
+    # Root guard takes precedence over BPDU guard when both are configured
+    if 'root_guard' in directives:
         meraki_port_config['stpGuard'] = 'root guard'
+    elif 'bpdu_guard' in directives:
+        meraki_port_config['stpGuard'] = 'bpdu guard'
 
-    if 'power inline never' in catalyst_port_config:
+    if 'poe_never' in directives:
         meraki_port_config['poeEnabled'] = False
 
     return meraki_port_config
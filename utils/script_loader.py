@@ -3,21 +3,52 @@ Utility for loading external script modules dynamically.
 """
 
 import importlib.util
+import threading
 import traceback
 import sys
 import os
+from collections.abc import Mapping
 from config.script_types import ScriptType
 
+class _LazyModules(Mapping):
+    """
+    Read-only mapping of ScriptType to script module that loads each module on first access.
+
+    Keeps the dict interface the controllers use (get, membership, truthiness)
+    while deferring each script's import until it is actually needed.
+    """
+    def __init__(self, loader):
+        self._loader = loader
+
+    def __getitem__(self, script_type):
+        module = self._loader.get_module(script_type)
+        if module is None:
+            raise KeyError(script_type)
+        return module
+
+    def __iter__(self):
+        return iter(self._loader.specs)
+
+    def __len__(self):
+        return len(self._loader.specs)
+
+
 class ScriptLoader:
     """
     Handles loading of external script modules required by the application.
+
+    Script files are located at startup but only executed the first time a
+    module is requested, so scripts the user never runs are never imported.
     """
     def __init__(self):
         """Initialize the script loader."""
         self.modules = {}
+        self.specs = {}
         self.script_dir = self._get_script_path()
+        self._lock = threading.Lock()
 
-    def _get_script_path(self):
+    @staticmethod
+    def _get_script_path():
         """Get the path to the scripts directory, works both in development and when packaged."""
         if getattr(sys, 'frozen', False):
             base_path = sys._MEIPASS
@@ -28,10 +59,13 @@ class ScriptLoader:
 
     def load_scripts(self):
         """
-        Load all required script modules using ScriptType enum.
+        Locate all required script modules using ScriptType enum.
+
+        Modules are executed lazily on first access through the returned mapping
+        or get_module().
 
         Returns:
-            dict: A dictionary of loaded modules or None if loading failed
+            Mapping: ScriptType to module mapping, or None if a script file is missing
         """
         try:
             scripts = {
@@ -41,15 +75,12 @@ class ScriptLoader:
             }
 
             for script_type, filename in scripts.items():
-                spec = importlib.util.spec_from_file_location(
-                    script_type.name,
-                    os.path.join(self.script_dir, filename)
-                )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                self.modules[script_type] = module
+                path = os.path.join(self.script_dir, filename)
+                if not os.path.isfile(path):
+                    raise FileNotFoundError(f"Script not found: {path}")
+                self.specs[script_type] = importlib.util.spec_from_file_location(script_type.name, path)
 
-            return self.modules
+            return _LazyModules(self)
 
         except Exception as e:
             print(f"Error loading scripts: {e}")
@@ -58,14 +89,33 @@ class ScriptLoader:
 
     def get_module(self, script_type):
         """
-        Get a loaded module by ScriptType.
+        Get a module by ScriptType, executing it on first request.
 
         Args:
             script_type (ScriptType): The ScriptType enum value of the module to get
 
         Returns:
-            module or None: The requested module or None if not found
+            module or None: The requested module or None if not found or it failed to load
         """
         if not isinstance(script_type, ScriptType):
             raise ValueError(f"Expected ScriptType enum, got {type(script_type)}")
-        return self.modules.get(script_type)
+
+        with self._lock:
+            module = self.modules.get(script_type)
+            if module is not None:
+                return module
+
+            spec = self.specs.get(script_type)
+            if spec is None:
+                return None
+
+            try:
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+            except Exception as e:
+                print(f"Error loading script {script_type.value}: {e}")
+                traceback.print_exc()
+                return None
+
+            self.modules[script_type] = module
+            return module
@@ -2,11 +2,65 @@
 Threading utilities for running tasks in the background.
 """
 
+import functools
+import inspect
 import threading
 import sys
 import traceback
+from concurrent.futures import CancelledError
 from tkinter import messagebox
-from .console_redirect import ConsoleRedirector
+from config.constants import BACKGROUND_TASK_MAX_WORKERS
+from .context_executor import ContextThreadPoolExecutor
+from .console_redirect import ConsoleRedirector, install_stdout_router, use_console, restore_console
+
+
+# Shared pool for background tasks; its daemon workers let closing the window end
+# the process immediately
+_POOL = ContextThreadPoolExecutor(BACKGROUND_TASK_MAX_WORKERS, "bg-task")
+
+
+def _show_error(error):
+    """Default error callback: report the error in a dialog."""
+    messagebox.showerror("Error", f"An error occurred: {str(error)}")
+
+
+def _accepts_cancel_event(task_function):
+    """Return True if task_function takes a cancel_event argument."""
+    try:
+        return 'cancel_event' in inspect.signature(task_function).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+class TaskHandle:
+    """
+    Handle for a task started by BackgroundTask.run.
+
+    Attributes:
+        future: concurrent.futures.Future for the task
+        cancel_event: threading.Event set by cancel(); a task that accepts a
+                      cancel_event argument polls it and raises CancelledError
+    """
+    def __init__(self, future, cancel_event):
+        self.future = future
+        self.cancel_event = cancel_event
+
+    def cancel(self):
+        """
+        Ask the task to stop.
+
+        A queued task is dropped; a running one is signalled through cancel_event.
+
+        Returns:
+            bool: True if the task was dropped before it started
+        """
+        self.cancel_event.set()
+        return self.future.cancel()
+
+    def done(self):
+        """Return True if the task has finished or was dropped."""
+        return self.future.done()
+
 
 class BackgroundTask:
     """
@@ -14,41 +68,79 @@ class BackgroundTask:
     """
 
     @staticmethod
-    def run(task_function, console_widget=None, success_callback=None, error_callback=None):
+    def run(task_function, console_widget=None, success_callback=None, error_callback=None,
+            tk_root=None, cancel_event=None):
         """
-        Run a task in a background thread.
+        Run a task on a shared pool of background worker threads.
+
+        The callbacks, and the default error dialog, run on the Tk main thread once
+        the task's console output has been inserted, so they may update widgets.
+        A task cancelled by raising CancelledError calls error_callback, if given,
+        but never shows the default error dialog.
 
         Args:
             task_function: The function to run in the background
-            console_widget: Optional tkinter widget to redirect stdout to
+            console_widget: Optional tkinter widget that receives the task's print() output
             success_callback: Optional function to call on successful completion
             error_callback: Optional function to call on error
+            tk_root: Optional widget whose event loop runs the callbacks.
+                     Default: console_widget's toplevel window
+            cancel_event: Optional threading.Event for cooperative cancellation, passed
+                          to task_function if it has a cancel_event parameter.
+                          Default: a new Event
+
+        Returns:
+            TaskHandle: Handle to cancel the task or check whether it is done
         """
+        # Output is routed per task through a context variable rather than by swapping
+        # sys.stdout, so concurrent tasks each write to their own console
+        install_stdout_router()
+        redirector = ConsoleRedirector(console_widget) if console_widget else None
+        if tk_root is None and console_widget is not None:
+            tk_root = console_widget.winfo_toplevel()
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        if _accepts_cancel_event(task_function):
+            task_function = functools.partial(task_function, cancel_event=cancel_event)
+
+        def finish(callback, value):
+            if redirector:
+                redirector.drain()
+            callback(value)
+
         def run_task():
-            original_stdout = sys.stdout
+            token = use_console(redirector)
             try:
-                if console_widget:
-                    redirector = ConsoleRedirector(console_widget)
-                    sys.stdout = redirector
-
                 result = task_function()
-
-                if success_callback:
-                    success_callback(result)
-
+            except CancelledError as e:
+                if console_widget:
+                    print("\nCancelled.")
+                callback, value = error_callback, e
             except Exception as e:
                 if console_widget:
-                    console_widget.insert("end", f"\nError: {str(e)}\n")
+                    print(f"\nError: {str(e)}")
                     traceback.print_exc(file=sys.stdout)
-
-                if error_callback:
-                    error_callback(e)
-                else:
-                    messagebox.showerror("Error", f"An error occurred: {str(e)}")
+                callback, value = error_callback or _show_error, e
+            else:
+                callback, value = success_callback, result
             finally:
-                sys.stdout = original_stdout
+                restore_console(token)
+                if redirector:
+                    redirector.close()
+
+            if callback is None:
+                return
+            if tk_root is None:
+                callback(value)
+            else:
+                tk_root.after(0, finish, callback, value)
+
+        def close_if_dropped(future):
+            # A task dropped before it started never closes its console itself
+            if future.cancelled():
+                redirector.close()
 
-        thread = threading.Thread(target=run_task)
-        thread.daemon = True
-        thread.start()
-        return thread
+        future = _POOL.submit(run_task)
+        if redirector:
+            future.add_done_callback(close_if_dropped)
+        return TaskHandle(future, cancel_event)
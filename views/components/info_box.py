@@ -4,11 +4,21 @@ Info/help box component for displaying contextual help.
 
 import tkinter as tk
 from tkinter import ttk
+from dataclasses import dataclass
 from typing import Optional
 
 from config.theme import Colors, Fonts, Spacing
 
 
+@dataclass(frozen=True)
+class _BoxStyle:
+    """Colors and icon for one InfoBox type."""
+    bg: str
+    border: str
+    icon: str
+    icon_color: str
+
+
 class InfoBox(ttk.Frame):
     """
     A styled info/help box for displaying contextual help messages.
@@ -21,36 +31,36 @@ class InfoBox(ttk.Frame):
 
     # Box types with their styling
     TYPES = {
-        'info': {
-            'bg': '#E0F2FE',           # Light blue
-            'border': Colors.PRIMARY,
-            'icon': '\u2139',          # Info symbol
-            'icon_color': Colors.PRIMARY
-        },
-        'warning': {
-            'bg': Colors.WARNING_BG,
-            'border': Colors.WARNING,
-            'icon': '\u26A0',          # Warning triangle
-            'icon_color': Colors.WARNING
-        },
-        'error': {
-            'bg': Colors.ERROR_BG,
-            'border': Colors.ERROR,
-            'icon': '\u2716',          # X symbol
-            'icon_color': Colors.ERROR
-        },
-        'success': {
-            'bg': Colors.SUCCESS_BG,
-            'border': Colors.SUCCESS,
-            'icon': '\u2714',          # Checkmark
-            'icon_color': Colors.SUCCESS
-        },
-        'help': {
-            'bg': '#F3F4F6',           # Light gray
-            'border': Colors.TEXT_SECONDARY,
-            'icon': '?',               # Question mark
-            'icon_color': Colors.TEXT_SECONDARY
-        }
+        'info': _BoxStyle(
+            bg='#E0F2FE',              # Light blue
+            border=Colors.PRIMARY,
+            icon='\u2139',             # Info symbol
+            icon_color=Colors.PRIMARY,
+        ),
+        'warning': _BoxStyle(
+            bg=Colors.WARNING_BG,
+            border=Colors.WARNING,
+            icon='\u26A0',             # Warning triangle
+            icon_color=Colors.WARNING,
+        ),
+        'error': _BoxStyle(
+            bg=Colors.ERROR_BG,
+            border=Colors.ERROR,
+            icon='\u2716',             # X symbol
+            icon_color=Colors.ERROR,
+        ),
+        'success': _BoxStyle(
+            bg=Colors.SUCCESS_BG,
+            border=Colors.SUCCESS,
+            icon='\u2714',             # Checkmark
+            icon_color=Colors.SUCCESS,
+        ),
+        'help': _BoxStyle(
+            bg='#F3F4F6',              # Light gray
+            border=Colors.TEXT_SECONDARY,
+            icon='?',                  # Question mark
+            icon_color=Colors.TEXT_SECONDARY,
+        ),
     }
 
     def __init__(
@@ -80,33 +90,40 @@ class InfoBox(ttk.Frame):
 
     def _create_ui(self):
         """Create the info box UI."""
+        style = self.type_config
+        bg = style.bg
+
         # Container with border
         self.container = tk.Frame(
             self,
-            bg=self.type_config['bg'],
+            bg=bg,
             highlightthickness=1,
-            highlightbackground=self.type_config['border']
+            highlightbackground=style.border
         )
         self.container.pack(fill=tk.X, expand=True)
 
         # Inner padding frame
-        inner = tk.Frame(self.container, bg=self.type_config['bg'])
+        inner = tk.Frame(self.container, bg=bg)
         inner.pack(fill=tk.X, padx=Spacing.MD, pady=Spacing.SM)
 
         # Icon on the left
         icon_label = tk.Label(
             inner,
-            text=self.type_config['icon'],
+            text=style.icon,
             font=('Segoe UI', 14),
-            fg=self.type_config['icon_color'],
-            bg=self.type_config['bg']
+            fg=style.icon_color,
+            bg=bg
         )
         icon_label.pack(side=tk.LEFT, padx=(0, Spacing.SM))
+        self._icon_label = icon_label
 
         # Text container
-        text_frame = tk.Frame(inner, bg=self.type_config['bg'])
+        text_frame = tk.Frame(inner, bg=bg)
         text_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
+        # Widgets whose background follows the box type, restyled in place by set_type()
+        self._styled_bg_widgets = [self.container, inner, icon_label, text_frame]
+
         # Title (if provided)
         if self.title_text:
             title_label = tk.Label(
@@ -114,10 +131,11 @@ class InfoBox(ttk.Frame):
                 text=self.title_text,
                 font=Fonts.BOLD,
                 fg=Colors.TEXT_PRIMARY,
-                bg=self.type_config['bg'],
+                bg=bg,
                 anchor=tk.W
             )
             title_label.pack(fill=tk.X)
+            self._styled_bg_widgets.append(title_label)
 
         # Message
         self.message_label = tk.Label(
@@ -125,12 +143,13 @@ class InfoBox(ttk.Frame):
             text=self.message_text,
             font=Fonts.NORMAL,
             fg=Colors.TEXT_PRIMARY,
-            bg=self.type_config['bg'],
+            bg=bg,
             anchor=tk.W,
             justify=tk.LEFT,
             wraplength=500
         )
         self.message_label.pack(fill=tk.X)
+        self._styled_bg_widgets.append(self.message_label)
 
     def set_message(self, message: str):
         """Update the message text."""
@@ -146,8 +165,9 @@ class InfoBox(ttk.Frame):
         """
         if box_type in self.TYPES:
             self.box_type = box_type
-            self.type_config = self.TYPES[box_type]
-            # Recreate UI with new style
-            for widget in self.winfo_children():
-                widget.destroy()
-            self._create_ui()
+            style = self.type_config = self.TYPES[box_type]
+            # Recolor the existing widgets rather than rebuilding them
+            for widget in self._styled_bg_widgets:
+                widget.configure(bg=style.bg)
+            self.container.configure(highlightbackground=style.border)
+            self._icon_label.configure(text=style.icon, fg=style.icon_color)
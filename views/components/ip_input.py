@@ -2,13 +2,18 @@
 IP address input component with validation.
 """
 
-import re
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Optional
 
+from config.constants import INPUT_VALIDATION_DELAY_MS
 from config.theme import Colors, Fonts, Spacing
 
+# Every valid dotted-quad octet: 0-255 with up to three digits, leading zeros allowed
+_IP_OCTETS = frozenset(
+    f'{value:0{width}d}' for value in range(256) for width in (1, 2, 3) if value < 10 ** width
+)
+
 
 class IPInput(ttk.Frame):
     """
@@ -17,16 +22,10 @@ class IPInput(ttk.Frame):
     Features:
     - Label and input field
     - Example text placeholder
-    - Real-time validation with visual feedback
+    - Real-time validation with visual feedback, run once typing pauses
     - Validation callback
     """
 
-    # IP address validation pattern
-    IP_PATTERN = re.compile(
-        r'^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}'
-        r'(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-    )
-
     def __init__(
         self,
         parent,
@@ -49,6 +48,10 @@ class IPInput(ttk.Frame):
         self.placeholder_text = placeholder
         self.on_change = on_change
         self._is_valid = False
+        self._validate_after_id = None
+        # Last state applied to the indicator and error labels, so unchanged states skip the Tk call
+        self._indicator_state = ("", None)
+        self._error_text = ""
 
         self._create_ui()
 
@@ -105,33 +108,63 @@ class IPInput(ttk.Frame):
         self.error_label.pack(anchor=tk.W)
 
     def _on_input_change(self, *args):
-        """Handle input changes and validate."""
+        """Handle input changes by validating once typing pauses."""
+        if self._validate_after_id:
+            self.after_cancel(self._validate_after_id)
+        self._validate_after_id = self.after(INPUT_VALIDATION_DELAY_MS, self._do_validate)
+
+    def _flush_validation(self):
+        """Run a pending validation now so the current value is reflected."""
+        if self._validate_after_id:
+            self.after_cancel(self._validate_after_id)
+            self._do_validate()
+
+    def _do_validate(self):
+        """Validate the current input and update the indicator and error text."""
+        self._validate_after_id = None
         value = self.ip_var.get().strip()
 
         if not value:
             # Empty - neutral state
             self._is_valid = False
-            self.indicator.config(text="")
-            self.error_label.config(text="")
+            self._set_indicator("")
+            self._set_error_text("")
         elif self._validate_ip(value):
             # Valid IP
             self._is_valid = True
-            self.indicator.config(text="\u2714", foreground=Colors.SUCCESS)
-            self.error_label.config(text="")
+            self._set_indicator("\u2714", Colors.SUCCESS)
+            self._set_error_text("")
         else:
             # Invalid IP
             self._is_valid = False
-            self.indicator.config(text="\u2716", foreground=Colors.ERROR)
+            self._set_indicator("\u2716", Colors.ERROR)
             # Show error only if it looks like a complete attempt
             if len(value) > 6:
-                self.error_label.config(text="Please enter a valid IP address")
+                self._set_error_text("Please enter a valid IP address")
             else:
-                self.error_label.config(text="")
+                self._set_error_text("")
 
         # Call change callback
         if self.on_change:
             self.on_change(value, self._is_valid)
 
+    def _set_indicator(self, text: str, foreground: Optional[str] = None):
+        """Show text in the validation indicator unless it already shows this state."""
+        state = (text, foreground)
+        if state == self._indicator_state:
+            return
+        self._indicator_state = state
+        if foreground is None:
+            self.indicator.configure(text=text)
+        else:
+            self.indicator.configure(text=text, foreground=foreground)
+
+    def _set_error_text(self, text: str):
+        """Show text in the error label unless it already shows it."""
+        if text != self._error_text:
+            self._error_text = text
+            self.error_label.configure(text=text)
+
     def _validate_ip(self, ip: str) -> bool:
         """
         Validate an IP address.
@@ -142,7 +175,9 @@ class IPInput(ttk.Frame):
         Returns:
             True if valid, False otherwise
         """
-        return bool(self.IP_PATTERN.match(ip))
+        octets = ip.split('.')
+        return (len(octets) == 4 and octets[0] in _IP_OCTETS and octets[1] in _IP_OCTETS
+                and octets[2] in _IP_OCTETS and octets[3] in _IP_OCTETS)
 
     def get_value(self) -> str:
         """Get the current IP address value."""
@@ -154,6 +189,7 @@ class IPInput(ttk.Frame):
 
     def is_valid(self) -> bool:
         """Check if the current value is a valid IP address."""
+        self._flush_validation()
         return self._is_valid
 
     def validate(self) -> tuple[bool, str]:
@@ -163,6 +199,7 @@ class IPInput(ttk.Frame):
         Returns:
             Tuple of (is_valid, error_message)
         """
+        self._flush_validation()
         value = self.get_value()
         if not value:
             return False, "IP address is required"
@@ -170,19 +207,26 @@ class IPInput(ttk.Frame):
             return False, "Please enter a valid IP address"
         return True, ""
 
+    def destroy(self):
+        """Cancel any pending validation before destroying the widget."""
+        if self._validate_after_id:
+            self.after_cancel(self._validate_after_id)
+            self._validate_after_id = None
+        super().destroy()
+
     def focus(self):
         """Set focus to the entry field."""
         self.entry.focus_set()
 
     def set_error(self, message: str):
         """Display an error message."""
-        self.error_label.config(text=message)
-        self.indicator.config(text="\u2716", foreground=Colors.ERROR)
+        self._set_error_text(message)
+        self._set_indicator("\u2716", Colors.ERROR)
 
     def clear_error(self):
         """Clear the error message."""
-        self.error_label.config(text="")
+        self._set_error_text("")
         if self._is_valid:
-            self.indicator.config(text="\u2714", foreground=Colors.SUCCESS)
+            self._set_indicator("\u2714", Colors.SUCCESS)
         else:
-            self.indicator.config(text="")
+            self._set_indicator("")
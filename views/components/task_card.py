@@ -43,6 +43,7 @@ class TaskCard(tk.Frame):
         self.icon_text = icon
         self.on_click = on_click
         self._is_hovered = False
+        self._enabled = True
 
         # Colors for normal and hover states
         self._bg_normal = Colors.BG_CARD
@@ -79,15 +80,16 @@ class TaskCard(tk.Frame):
         # Spacer at top
         tk.Frame(self.content, bg=self._bg_normal, height=10).grid(row=0, column=0, sticky="nsew")
 
-        # Icon (if provided)
+        # Icon, always created so the other methods need not check for it;
+        # only placed in the grid if provided
+        self.icon_label = tk.Label(
+            self.content,
+            text=self.icon_text or "",
+            bg=self._bg_normal,
+            fg=self._fg_normal,
+            font=('Segoe UI', 36)
+        )
         if self.icon_text:
-            self.icon_label = tk.Label(
-                self.content,
-                text=self.icon_text,
-                bg=self._bg_normal,
-                fg=self._fg_normal,
-                font=('Segoe UI', 36)
-            )
             self.icon_label.grid(row=1, column=0, pady=(0, Spacing.SM))
 
         # Title
@@ -116,68 +118,76 @@ class TaskCard(tk.Frame):
         tk.Frame(self.content, bg=self._bg_normal, height=10).grid(row=4, column=0, sticky="nsew")
 
         # Store all widgets that need color updates
-        self._widgets = [self.card, self.content]
-        if hasattr(self, 'icon_label'):
-            self._widgets.append(self.icon_label)
-        self._widgets.extend([self.title_label, self.desc_label])
+        self._widgets = [self.card, self.content, self.icon_label, self.title_label, self.desc_label]
 
         # Add spacer frames
         for child in self.content.winfo_children():
             if isinstance(child, tk.Frame):
                 self._widgets.append(child)
 
+        # Full per-widget options for each state, so a hover change is one configure() per widget
+        self._normal_style = self._build_style(
+            self._bg_normal, self._fg_normal, self._fg_secondary_normal, Colors.BORDER)
+        self._hover_style = self._build_style(
+            self._bg_hover, self._fg_hover, self._fg_secondary_hover, self._bg_hover)
+
     def _bind_events(self):
         """Bind mouse events for hover and click."""
+        # Hover is tracked on the card alone. Moving onto one of its own widgets also
+        # sends the card a Leave, with detail NotifyInferior; tkinter's Event does not
+        # carry the detail, so the Leave handler is bound with the %d substitution
+        self.card.bind('<Enter>', self._on_enter)
+        self.card.bind('<Leave>', f'{self.register(self._on_leave)} %d')
+
+        # Clicks go to the widget under the pointer, so every widget carries a
+        # per-card bind tag and the click is bound once on that tag
+        click_tag = f'TaskCard{id(self)}'
         for widget in self._widgets:
-            widget.bind('<Enter>', self._on_enter)
-            widget.bind('<Leave>', self._on_leave)
-            widget.bind('<Button-1>', self._on_click)
+            widget.bindtags((click_tag,) + widget.bindtags())
+        self.bind_class(click_tag, '<Button-1>', self._on_click)
 
-    def _set_colors(self, bg, fg, fg_secondary):
-        """Update all widget colors."""
-        for widget in self._widgets:
-            widget.configure(bg=bg)
+    def _build_style(self, bg, fg, fg_secondary, border):
+        """
+        Build the configure() options for every card widget in one state.
 
-        self.title_label.configure(fg=fg)
-        if hasattr(self, 'icon_label'):
-            self.icon_label.configure(fg=fg)
-        self.desc_label.configure(fg=fg_secondary)
+        Returns:
+            list: (widget, options) pairs
+        """
+        style = []
+        for widget in self._widgets:
+            options = {'bg': bg}
+            if widget is self.card:
+                options['highlightbackground'] = border
+            elif widget is self.desc_label:
+                options['fg'] = fg_secondary
+            elif isinstance(widget, tk.Label):
+                options['fg'] = fg
+            style.append((widget, options))
+        return style
+
+    def _apply_style(self, style):
+        """Apply a style from _build_style()."""
+        for widget, options in style:
+            widget.configure(**options)
 
     def _on_enter(self, event):
         """Handle mouse enter."""
-        if not self._is_hovered:
+        if self._enabled and not self._is_hovered:
             self._is_hovered = True
-            self._set_colors(self._bg_hover, self._fg_hover, self._fg_secondary_hover)
-            self.card.configure(highlightbackground=self._bg_hover)
-
-    def _on_leave(self, event):
-        """Handle mouse leave."""
-        # Check if we're still within the card bounds
-        x, y = self.winfo_pointerxy()
-        card_x = self.card.winfo_rootx()
-        card_y = self.card.winfo_rooty()
-        card_w = self.card.winfo_width()
-        card_h = self.card.winfo_height()
-
-        if not (card_x <= x <= card_x + card_w and
-                card_y <= y <= card_y + card_h):
+            self._apply_style(self._hover_style)
+
+    def _on_leave(self, detail):
+        """Handle mouse leave; detail is the Tk crossing detail of the Leave event."""
+        if self._is_hovered and detail != 'NotifyInferior':
             self._is_hovered = False
-            self._set_colors(self._bg_normal, self._fg_normal, self._fg_secondary_normal)
-            self.card.configure(highlightbackground=Colors.BORDER)
+            self._apply_style(self._normal_style)
 
     def _on_click(self, event):
         """Handle mouse click."""
-        if self.on_click:
+        if self._enabled and self.on_click:
             self.on_click()
 
     def set_enabled(self, enabled: bool):
         """Enable or disable the card."""
-        if enabled:
-            self.card.configure(cursor="hand2")
-            self._bind_events()
-        else:
-            self.card.configure(cursor="arrow")
-            for widget in self._widgets:
-                widget.unbind('<Enter>')
-                widget.unbind('<Leave>')
-                widget.unbind('<Button-1>')
+        self._enabled = enabled
+        self.card.configure(cursor="hand2" if enabled else "arrow")
@@ -8,6 +8,9 @@ import re
 
 from config.theme import Colors, Fonts, Spacing
 
+# Meraki serial format, e.g. Q2XX-AB12-CD34
+_SERIAL_PATTERN = re.compile(r"^[A-Za-z0-9]{4}-[A-Za-z0-9]{4}-[A-Za-z0-9]{4}$")
+
 class SerialListManager(tk.Toplevel):
     """
     Dialog for managing a list of Meraki serial numbers.
@@ -141,8 +144,7 @@ class SerialListManager(tk.Toplevel):
             bool: True if valid, False otherwise
         """
         # Simple validation - can be enhanced as needed
-        pattern = r"^[A-Za-z0-9]{4}-[A-Za-z0-9]{4}-[A-Za-z0-9]{4}$"
-        return re.match(pattern, serial)
+        return _SERIAL_PATTERN.match(serial)
             
     def edit_serial(self, event=None):
         """Edit the selected serial number."""
@@ -29,6 +29,8 @@ class WizardProgressBar(ttk.Frame):
         self.steps = steps
         self.current_step = current_step
         self.step_widgets = []
+        # (width, current_step) of the last drawing, so resize events that keep it skip the redraw
+        self._drawn_state = None
 
         self._create_ui()
 
@@ -45,10 +47,15 @@ class WizardProgressBar(ttk.Frame):
 
     def _draw_progress(self, event=None):
         """Draw the progress bar with circles and lines."""
-        self.canvas.delete('all')
+        # <Configure> fires for every resize tick and move; only the width and
+        # current step change the drawing
+        width = event.width if event is not None else self.canvas.winfo_width()
+        state = (width, self.current_step)
+        if state == self._drawn_state:
+            return
+        self._drawn_state = state
 
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
+        self.canvas.delete('all')
 
         if width < 100 or len(self.steps) == 0:
             return
@@ -3,6 +3,7 @@ Comparison Wizard - 3-step wizard for comparing Catalyst and Meraki switches.
 """
 
 import tkinter as tk
+from concurrent.futures import CancelledError
 from tkinter import ttk, scrolledtext
 from typing import Callable, Optional
 
@@ -68,6 +69,10 @@ class ComparisonWizard(ttk.Frame):
         self.captured_mac_data = None
         self.captured_hostname = ''
 
+        # Running background tasks, cancelled when the wizard is closed
+        self._capture_task = None
+        self._comparison_task = None
+
         # UI references
         self.ip_input = None
         self.cred_display_label = None
@@ -81,6 +86,13 @@ class ComparisonWizard(ttk.Frame):
 
         self._create_wizard()
 
+    def destroy(self):
+        """Cancel any running capture or comparison, then destroy the wizard."""
+        for task in (self._capture_task, self._comparison_task):
+            if task is not None:
+                task.cancel()
+        super().destroy()
+
     def _create_wizard(self):
         """Create the wizard with all steps."""
         steps = [
@@ -398,6 +410,7 @@ class ComparisonWizard(ttk.Frame):
     def _run_capture(self):
         """Run the capture process."""
         from utils.workers import BackgroundTask
+        from utils.context_executor import raise_if_cancelled
 
         credentials = [{
             'username': self.wizard_data['credentials']['username'],
@@ -406,7 +419,7 @@ class ComparisonWizard(ttk.Frame):
 
         catalyst_ip = self.wizard_data['catalyst_ip']
 
-        def do_capture():
+        def do_capture(cancel_event):
             from utils.netmiko_utils import get_running_config
             import pandas as pd
 
@@ -425,6 +438,7 @@ class ComparisonWizard(ttk.Frame):
                 results['hostname'] = hostname
 
             # Capture MACs if selected
+            raise_if_cancelled(cancel_event)
             if self.wizard_data['compare_macs']:
                 macs_raw, hostname = get_running_config(
                     ip_address=catalyst_ip,
@@ -449,7 +463,7 @@ class ComparisonWizard(ttk.Frame):
 
             return results
 
-        BackgroundTask.run(
+        self._capture_task = BackgroundTask.run(
             do_capture,
             console_widget=self.capture_console,
             success_callback=self._on_capture_success,
@@ -478,6 +492,9 @@ class ComparisonWizard(ttk.Frame):
 
     def _on_capture_error(self, error):
         """Handle capture error."""
+        if isinstance(error, CancelledError):
+            # Only closing the wizard cancels a capture, so its widgets are gone
+            return
         self._append_capture_console(f"\nError: {str(error)}\n")
         self.capture_btn.config(state='normal')
         self.capture_status_label.config(text="Capture failed", foreground=Colors.ERROR)
@@ -736,6 +753,7 @@ class ComparisonWizard(ttk.Frame):
     def _run_comparison(self):
         """Run the comparison."""
         from utils.workers import BackgroundTask
+        from utils.context_executor import raise_if_cancelled
         from utils.config_manager import get_api_key
         from config.script_types import ScriptType
 
@@ -750,12 +768,12 @@ class ComparisonWizard(ttk.Frame):
 
         meraki_serials = self.wizard_data['meraki_serials']
 
-        def do_comparison():
+        def do_comparison(cancel_event):
             results = {'interfaces': None, 'macs': None}
 
             # Compare interfaces
             if self.captured_interface_data is not None:
-                self._append_results_console("Comparing port status...\n")
+                print("Comparing port status...")
                 # This would use the actual comparison module
                 # For now, create mock results structure
                 results['interfaces'] = []
@@ -768,8 +786,9 @@ class ComparisonWizard(ttk.Frame):
                     })
 
             # Compare MACs
+            raise_if_cancelled(cancel_event)
             if self.captured_mac_data is not None and not self.captured_mac_data.empty:
-                self._append_results_console("Comparing connected devices...\n")
+                print("Comparing connected devices...")
                 results['macs'] = []
                 for _, row in self.captured_mac_data.iterrows():
                     results['macs'].append({
@@ -781,7 +800,7 @@ class ComparisonWizard(ttk.Frame):
 
             return results
 
-        BackgroundTask.run(
+        self._comparison_task = BackgroundTask.run(
             do_comparison,
             console_widget=self.results_console,
             success_callback=self._on_comparison_success,
@@ -805,6 +824,9 @@ class ComparisonWizard(ttk.Frame):
 
     def _on_comparison_error(self, error):
         """Handle comparison error."""
+        if isinstance(error, CancelledError):
+            # Only closing the wizard cancels a comparison, so its widgets are gone
+            return
         self.compare_btn.config(state='normal')
         self.results_status.config(text="Comparison failed", foreground=Colors.ERROR)
         self._append_results_console(f"\nError: {str(error)}\n")